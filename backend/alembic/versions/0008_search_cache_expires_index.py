@@ -0,0 +1,26 @@
+"""Index search cache expiry for range pruning.
+
+Revision ID: 0008_search_cache_expires_index
+Revises: 0007_price_history_notified
+Create Date: 2025-10-02
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008_search_cache_expires_index"
+down_revision = "0007_price_history_notified"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_search_cache_expires_at", "search_cache", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_search_cache_expires_at", table_name="search_cache")
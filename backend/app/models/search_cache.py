@@ -12,7 +12,7 @@ class SearchCache(IdentifierMixin, TimestampMixin, SQLModel, table=True):
     query_hash: str = Field(unique=True, index=True, nullable=False, max_length=64)
     query: str = Field(nullable=False, max_length=1024)
     response: dict[str, object] = Field(sa_column=Column(JSON, nullable=False))
-    expires_at: datetime = Field(nullable=False, default_factory=utcnow)
+    expires_at: datetime = Field(nullable=False, default_factory=utcnow, index=True)
 
 
 __all__ = ["SearchCache"]
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlalchemy import JSON, Column, UniqueConstraint, event
+from sqlalchemy.orm import object_session
 from sqlmodel import Field, Relationship, SQLModel
 
-from app.models.base import IdentifierMixin, TimestampMixin
+from app.models.base import IdentifierMixin, TimestampMixin, utcnow
 
 if TYPE_CHECKING:
     from app.models.product_url import ProductURL
@@ -44,3 +45,12 @@ def _ensure_relationship_dependencies() -> None:
 
 
 _ensure_relationship_dependencies()
+
+
+@event.listens_for(Store, "before_update")
+def _touch_updated_at(_mapper: Any, _connection: Any, target: Store) -> None:
+    # Caches keyed on a user's newest store timestamp rely on every column edit
+    # moving it; relationship-only flushes leave the row untouched.
+    session = object_session(target)
+    if session is None or session.is_modified(target, include_collections=False):
+        target.updated_at = utcnow()
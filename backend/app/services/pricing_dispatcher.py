@@ -3,14 +3,10 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from celery.result import AsyncResult
-
-from app.tasks.pricing import (
-    update_all_products_task,
-    update_product_prices_task,
-)
+if TYPE_CHECKING:
+    from celery.result import AsyncResult
 
 
 @dataclass(slots=True)
@@ -44,6 +40,8 @@ class PricingDispatcher:
         audit_actor_id: int | None,
         audit_ip: str | None,
     ) -> PricingJobDispatch:
+        from app.tasks.pricing import update_product_prices_task
+
         result = update_product_prices_task.delay(
             product_id=product_id,
             logging=logging,
@@ -60,6 +58,8 @@ class PricingDispatcher:
         audit_actor_id: int | None,
         audit_ip: str | None,
     ) -> PricingJobDispatch:
+        from app.tasks.pricing import update_all_products_task
+
         result = update_all_products_task.delay(
             logging=logging,
             owner_id=owner_id,
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import copy
 import json
 import math
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -75,12 +77,42 @@ def describe_pricing_schedule(
     *,
     now: datetime | None = None,
 ) -> list[dict[str, Any]]:
+    """Describe configured beat entries with their last and next run times.
+
+    The parsed schedule file is memoised per revision; run times are always
+    evaluated against ``now``. Call :func:`clear_pricing_schedule_cache` to
+    drop the parsed file.
+    """
+
     schedule_path = resolve_schedule_path(settings.celery_beat_schedule_path)
+    now_value = now or utcnow()
+    last_runs = fetch_last_run_map(session) if session is not None else {}
+    return _describe_schedule(schedule_path, now_value, last_runs)
+
+
+def clear_pricing_schedule_cache() -> None:
+    _load_schedule_revision.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _load_schedule_revision(path: Path, _mtime_ns: int) -> dict[str, dict[str, Any]]:
+    # Keyed on mtime_ns so an edited file is re-read; entries are copied by
+    # _build_description before anything is handed to callers.
+    return load_schedule_mapping(path)
+
+
+def _describe_schedule(
+    schedule_path: Path | None,
+    now_value: datetime,
+    last_runs: Mapping[str, datetime],
+) -> list[dict[str, Any]]:
     mapping: dict[str, dict[str, Any]]
 
     if schedule_path and schedule_path.exists():
         try:
-            mapping = load_schedule_mapping(schedule_path)
+            mapping = _load_schedule_revision(
+                schedule_path, schedule_path.stat().st_mtime_ns
+            )
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             _LOGGER.warning(
                 "celery.schedule.load_failed",
@@ -94,9 +126,6 @@ def describe_pricing_schedule(
     if not mapping:
         mapping = {key: value.copy() for key, value in _DEFAULT_SCHEDULE.items()}
 
-    now_value = now or utcnow()
-    last_runs = fetch_last_run_map(session) if session is not None else {}
-
     descriptions: list[dict[str, Any]] = []
     for name, entry in mapping.items():
         descriptions.append(
@@ -119,7 +148,7 @@ def _build_description(
     now_value: datetime,
     last_runs: Mapping[str, datetime],
 ) -> dict[str, Any]:
-    payload = dict(entry)
+    payload = copy.deepcopy(dict(entry))
     task = str(payload.get("task", name))
     enabled = payload.get("enabled", True) is not False
     args = list(payload.get("args", []) or [])
@@ -336,6 +365,7 @@ def _cron_interval(expression: str, reference: datetime | None) -> timedelta | N
 
 __all__ = [
     "ScheduleDescription",
+    "clear_pricing_schedule_cache",
     "describe_pricing_schedule",
     "estimate_schedule_interval",
     "load_schedule_mapping",
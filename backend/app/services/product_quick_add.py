@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 from html.parser import HTMLParser
-from typing import Any
+from typing import Any, Generic, TypeVar
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -152,50 +155,87 @@ def _slugify(value: str) -> str:
     return v or "item"
 
 
-def _normalise_host(value: str) -> str:
+_T = TypeVar("_T")
+
+_HTML_MEMO_SIZE = 32
+
+
+class _HtmlMemo(Generic[_T]):
+    """Small LRU over HTML payloads keyed on a digest of the document.
+
+    ``functools.lru_cache`` would keep every cached page alive as its key;
+    only the 16-byte digest and the parsed result are retained here. Sync
+    route handlers share the memo across threadpool workers, so the entry
+    bookkeeping runs under a lock while the parse itself does not.
+    """
+
+    __slots__ = ("_compute", "_entries", "_lock", "hits")
+
+    def __init__(self, compute: Callable[[str], _T]) -> None:
+        self._compute = compute
+        self._entries: dict[bytes, _T] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def __call__(self, html: str) -> _T:
+        key = hashlib.blake2b(
+            html.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        with self._lock:
+            if key in self._entries:
+                value = self._entries[key] = self._entries.pop(key)
+                self.hits += 1
+                return value
+        value = self._compute(html)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= _HTML_MEMO_SIZE:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = value
+        return value
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _NormalisedHost:
+    slug: str
+    display_name: str
+    domains: tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def _normalise_host(value: str) -> _NormalisedHost:
     host = value.strip().lower()
     if ":" in host:
         host = host.split(":", 1)[0]
-    return host
+    canonical = host[4:] if host.startswith("www.") else host
+
+    label = canonical.split(".", 1)[0] if "." in canonical else canonical
+    friendly = label.replace("-", " ").strip()
+    display_name = friendly.title() if friendly else value.title()
+
+    domains = (canonical, f"www.{canonical}") if canonical else ()
+    return _NormalisedHost(
+        slug=_slugify(canonical.replace(".", "-")),
+        display_name=display_name,
+        domains=domains,
+    )
 
 
 def _derive_store_slug(host: str) -> str:
-    canonical = _normalise_host(host)
-    if canonical.startswith("www."):
-        canonical = canonical[4:]
-    slug_source = canonical.replace(".", "-")
-    return _slugify(slug_source)
+    return _normalise_host(host).slug
 
 
 def _derive_store_name(host: str) -> str:
-    canonical = _normalise_host(host)
-    if canonical.startswith("www."):
-        canonical = canonical[4:]
-    if "." in canonical:
-        canonical = canonical.split(".", 1)[0]
-    friendly = canonical.replace("-", " ").strip()
-    if friendly:
-        return friendly.title()
-    return host.title()
+    return _normalise_host(host).display_name
 
 
 def _build_store_domains(host: str) -> list[StoreDomain]:
-    canonical = host.lower()
-    if canonical.startswith("www."):
-        canonical = canonical[4:]
-    raw_domains = [canonical]
-    alt = f"www.{canonical}" if canonical else None
-    if alt:
-        raw_domains.append(alt)
-
-    seen: set[str] = set()
-    domains: list[StoreDomain] = []
-    for domain in raw_domains:
-        if not domain or domain in seen:
-            continue
-        seen.add(domain)
-        domains.append(StoreDomain(domain=domain))
-    return domains
+    return [StoreDomain(domain=domain) for domain in _normalise_host(host).domains]
 
 
 def _merge_store_domains(store: Store, host: str) -> bool:
@@ -206,12 +246,11 @@ def _merge_store_domains(store: Store, host: str) -> bool:
         if isinstance(entry, dict) and isinstance(entry.get("domain"), str)
     }
     changed = False
-    for domain in _build_store_domains(host):
-        key = domain.domain.lower()
-        if key in seen:
+    for domain in _normalise_host(host).domains:
+        if domain in seen:
             continue
-        entries.append(domain.model_dump())
-        seen.add(key)
+        entries.append({"domain": domain})
+        seen.add(domain)
         changed = True
     if changed:
         store.domains = entries
@@ -261,6 +300,18 @@ def _detect_with_regex(
 
 
 def _auto_detect_strategy_fields(html: str) -> dict[str, StoreStrategyField]:
+    return {
+        field: candidate.model_copy()
+        for field, candidate in _detect_strategy_fields_cached(html)
+    }
+
+
+@_HtmlMemo
+def _detect_strategy_fields_cached(
+    html: str,
+) -> tuple[tuple[str, StoreStrategyField], ...]:
+    """Parse ``html`` once and memoise the detected fields per payload."""
+
     soup = BeautifulSoup(html, "html.parser") if html else None
     detected: dict[str, StoreStrategyField] = {}
     for field, config in _AUTO_CREATE_STRATEGIES.items():
@@ -273,7 +324,7 @@ def _auto_detect_strategy_fields(html: str) -> dict[str, StoreStrategyField]:
             candidate = _detect_with_regex(html, regexes, field)
         if candidate is not None:
             detected[field] = candidate
-    return detected
+    return tuple(detected.items())
 
 
 def _has_metadata_fields(payload: dict[str, Any]) -> bool:
@@ -684,6 +735,7 @@ def _first_match(html: str, *patterns: str) -> str | None:
     return None
 
 
+@_HtmlMemo
 def _extract_price_currency_from_ld_json(html: str) -> tuple[str | None, str | None]:
     if not html:
         return None, None
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any, cast
 
 import structlog
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import Session, select
 
 from app.models import AppSetting
@@ -12,6 +14,15 @@ _LOGGER = structlog.get_logger(__name__)
 
 _PREFIX = "schedule.last_run."
 
+_setting_key_column = cast(InstrumentedAttribute[Any], AppSetting.key)
+# The lower bound lets the primary key index seek straight to the prefix; the
+# LIKE keeps the match exact whatever collation the database applies.
+_LAST_RUN_STATEMENT = (
+    select(AppSetting.key, AppSetting.value)
+    .where(_setting_key_column >= _PREFIX)
+    .where(_setting_key_column.startswith(_PREFIX, autoescape=True))
+)
+
 
 def _setting_key(task_name: str) -> str:
     return f"{_PREFIX}{task_name}"
@@ -54,19 +65,18 @@ def record_schedule_run(
 def fetch_last_run_map(session: Session) -> dict[str, datetime]:
     """Return a mapping of task name to the last recorded run timestamp."""
 
-    rows = session.exec(select(AppSetting)).all()
     results: dict[str, datetime] = {}
-    for row in rows:
-        if not row.key.startswith(_PREFIX) or not row.value:
+    for key, value in session.exec(_LAST_RUN_STATEMENT):
+        if not value:
             continue
-        task_name = row.key[len(_PREFIX) :]
+        task_name = key[len(_PREFIX) :]
         try:
-            parsed = datetime.fromisoformat(row.value)
+            parsed = datetime.fromisoformat(value)
         except ValueError:
             _LOGGER.warning(
                 "schedule.run.parse_failed",
                 task=task_name,
-                value=row.value,
+                value=value,
             )
             continue
         if parsed.tzinfo is None:
@@ -4,8 +4,27 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+_PRICE_NUMBER_RE = re.compile(r"[-+]?\d[\d.,]*")
+_search_price_number = _PRICE_NUMBER_RE.search
+
+# CSS identifiers may not start with a digit or a hyphen followed by a digit;
+# soupsieve rejects those, so the fast path must not accept them either.
+_CSS_IDENT = r"-?[a-zA-Z_][\w-]*"
+_SIMPLE_SELECTOR_RE = re.compile(
+    rf"""
+    ^(?P<tag>[a-zA-Z][\w-]*)?
+    (?:\#(?P<id>{_CSS_IDENT}))?
+    (?:\.(?P<class>{_CSS_IDENT}))?
+    (?:\[(?P<attr>{_CSS_IDENT})\])?$
+    """,
+    re.VERBOSE,
+)
+
+_SimpleSelector = tuple[str | None, tuple[tuple[str, str | bool], ...]]
 
 
 def parse_strategy_selector(raw: str) -> tuple[str, str | None]:
@@ -37,7 +56,7 @@ def normalize_price_string(value: str) -> str | None:
     cleaned = value.strip().replace("\xa0", " ")
     if not cleaned:
         return None
-    match = re.search(r"[-+]?\d[\d.,]*", cleaned)
+    match = _search_price_number(cleaned)
     if match is None:
         return None
     numeric = match.group(0)
@@ -74,13 +93,63 @@ def normalize_strategy_data(field: str, raw_value: str | None) -> str | None:
     return value
 
 
+@lru_cache(maxsize=256)
+def _parse_simple_selector(selector: str) -> _SimpleSelector | None:
+    """Translate ``tag#id.class[attr]`` selectors into ``find`` arguments.
+
+    Returns ``None`` for anything richer (combinators, pseudo-classes, several
+    classes), which must go through the full CSS engine. So do attribute value
+    tests, whose case-sensitivity depends on the attribute (``type`` matches
+    case-insensitively in HTML), and ``[id]``/``[class]`` presence tests, which
+    would collide with the ``#id``/``.class`` shorthand.
+    """
+
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if match is None or not any(match.group("tag", "id", "class", "attr")):
+        return None
+    tag = match.group("tag")
+    attrs: list[tuple[str, str | bool]] = []
+    if match.group("id"):
+        attrs.append(("id", match.group("id")))
+    if match.group("class"):
+        attrs.append(("class", match.group("class")))
+    if match.group("attr"):
+        name = match.group("attr").lower()
+        if name in {"id", "class"}:
+            return None
+        attrs.append((name, True))
+    return (tag.lower() if tag else None), tuple(attrs)
+
+
+@lru_cache(maxsize=256)
+def _class_token_pattern(class_name: str) -> re.Pattern[str]:
+    return re.compile(rf"(?:^|\s){re.escape(class_name)}(?:\s|$)")
+
+
+def _strainer_value(name: str, value: str | bool) -> str | bool | re.Pattern[str]:
+    if name == "class" and isinstance(value, str):
+        # The strainer sees the raw attribute before it is split into a list.
+        return _class_token_pattern(value)
+    return value
+
+
+def _select_nodes(html: str, selector: str) -> list[Tag]:
+    simple = _parse_simple_selector(selector)
+    if simple is None:
+        soup = BeautifulSoup(html, "lxml")
+        return [node for node in soup.select(selector) if isinstance(node, Tag)]
+    tag, attr_pairs = simple
+    strainer = SoupStrainer(
+        tag, attrs={name: _strainer_value(name, value) for name, value in attr_pairs}
+    )
+    soup = BeautifulSoup(html, "lxml", parse_only=strainer)
+    return [node for node in soup.find_all(strainer) if isinstance(node, Tag)]
+
+
 def extract_with_css(
     html: str, selector: str, attr: str | None, field: str
 ) -> str | None:
-    soup = BeautifulSoup(html, "html.parser")
-    for node in soup.select(selector):
-        if not isinstance(node, Tag):
-            continue
+    for node in _select_nodes(html, selector):
         extracted = extract_element_value(node, attr)
         normalized = normalize_strategy_data(field, extracted)
         if normalized is not None:
@@ -88,11 +157,20 @@ def extract_with_css(
     return None
 
 
-def extract_with_regex(html: str, pattern: str, field: str) -> str | None:
+@lru_cache(maxsize=256)
+def _compile_strategy_pattern(pattern: str) -> re.Pattern[str] | None:
+    # Invalid patterns are cached as None so they are not recompiled per scrape.
     try:
-        match = re.search(pattern, html, flags=re.IGNORECASE | re.DOTALL)
+        return re.compile(pattern, flags=re.IGNORECASE | re.DOTALL)
     except re.error:
         return None
+
+
+def extract_with_regex(html: str, pattern: str, field: str) -> str | None:
+    compiled = _compile_strategy_pattern(pattern)
+    if compiled is None:
+        return None
+    match = compiled.search(html)
     if not match:
         return None
     extracted = match.group(1)
@@ -5,14 +5,15 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from hashlib import sha256
-from json import JSONDecodeError, loads
 from typing import Any, Protocol, cast
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 import structlog
 from fastapi import HTTPException, status
 from sqlalchemy import func
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import Session, select
 
 from app.core.config import Settings, settings
@@ -111,6 +112,9 @@ class SearxSearchService:
         self._settings = settings_obj or settings
         self._http_client_factory = http_client_factory or _default_http_client_factory
         self._timeout = DEFAULT_TIMEOUT
+        self._store_lookup_cache: dict[
+            int, tuple[tuple[datetime | None, int], dict[str, tuple[int, str]]]
+        ] = {}
 
     def search(
         self,
@@ -161,9 +165,10 @@ class SearxSearchService:
             page_count,
         )
 
+        now = utcnow()
         cached_results, cache_expiry = (None, None)
         if not force_refresh:
-            cached = self._load_cache(session, query_hash)
+            cached = self._load_cache(session, query_hash, now=now)
             if cached is not None:
                 cached_results, cache_expiry = cached
 
@@ -181,6 +186,7 @@ class SearxSearchService:
                     prepared_query,
                     raw_results,
                     ttl_seconds=integration.cache_ttl_seconds,
+                    now=now,
                 )
                 cache_hit = False
             except SearchExecutionError:
@@ -264,8 +270,8 @@ class SearxSearchService:
         if record is None or not record.value:
             return {}
         try:
-            payload = loads(record.value)
-        except (JSONDecodeError, TypeError):
+            payload = orjson.loads(record.value)
+        except orjson.JSONDecodeError:
             _logger.warning("search.invalid_integrated_services_payload")
             return {}
         if not isinstance(payload, dict):
@@ -274,17 +280,43 @@ class SearxSearchService:
         return searx_payload if isinstance(searx_payload, dict) else {}
 
     def _load_cache(
-        self, session: Session, query_hash: str
+        self,
+        session: Session,
+        query_hash: str,
+        *,
+        now: datetime | None = None,
     ) -> tuple[list[RawSearchResult], datetime] | None:
-        statement = select(SearchCache).where(SearchCache.query_hash == query_hash)
-        cached = session.exec(statement).first()
-        if cached is None:
-            return None
-        expiry = self._normalize_datetime(cached.expires_at)
-        if expiry <= utcnow():
-            return None
-        payload_raw = cached.response or {}
-        payload = cast(dict[str, Any], payload_raw)
+        return self._load_cache_many(session, [query_hash], now=now).get(query_hash)
+
+    def _load_cache_many(
+        self,
+        session: Session,
+        query_hashes: Iterable[str],
+        *,
+        now: datetime | None = None,
+    ) -> dict[str, tuple[list[RawSearchResult], datetime]]:
+        """Load unexpired cache entries for several query hashes in one query."""
+
+        unique_hashes = set(query_hashes)
+        if not unique_hashes:
+            return {}
+        reference = now or utcnow()
+        hash_column = cast(InstrumentedAttribute[Any], SearchCache.query_hash)
+        statement = select(SearchCache).where(hash_column.in_(unique_hashes))
+        loaded: dict[str, tuple[list[RawSearchResult], datetime]] = {}
+        for cached in session.exec(statement):
+            expiry = self._normalize_datetime(cached.expires_at)
+            if expiry <= reference:
+                continue
+            raw_results = self._raw_results_from_payload(cached.response)
+            if raw_results is not None:
+                loaded[cached.query_hash] = (raw_results, expiry)
+        return loaded
+
+    def _raw_results_from_payload(
+        self, payload_raw: dict[str, object] | None
+    ) -> list[RawSearchResult] | None:
+        payload = cast(dict[str, Any], payload_raw or {})
         results_raw = payload.get("results", [])
         if not isinstance(results_raw, list):
             return None
@@ -295,7 +327,7 @@ class SearxSearchService:
             raw = self._raw_from_dict(item)
             if raw is not None:
                 raw_results.append(raw)
-        return raw_results, expiry
+        return raw_results
 
     def _persist_cache(
         self,
@@ -305,8 +337,9 @@ class SearxSearchService:
         raw_results: list[RawSearchResult],
         *,
         ttl_seconds: int,
+        now: datetime | None = None,
     ) -> datetime:
-        expires_at = utcnow() + timedelta(seconds=ttl_seconds)
+        expires_at = (now or utcnow()) + timedelta(seconds=ttl_seconds)
         payload: dict[str, object] = {
             "results": [result.as_dict() for result in raw_results]
         }
@@ -353,11 +386,14 @@ class SearxSearchService:
                         data.get("results", []) if isinstance(data, dict) else []
                     )
                     for raw in raw_items:
+                        # Skip repeats before paying for URL parsing in
+                        # _normalize_result; its url is the stripped raw url.
+                        raw_url = raw.get("url") if isinstance(raw, dict) else None
+                        if isinstance(raw_url, str) and raw_url.strip() in seen_urls:
+                            continue
                         normalized = self._normalize_result(raw)
                         if normalized is None:
                             continue
-                        if normalized.url in seen_urls:
-                            continue
                         seen_urls.add(normalized.url)
                         results.append(normalized)
         except httpx.HTTPError as exc:
@@ -502,6 +538,21 @@ class SearxSearchService:
     def _build_store_lookup(
         self, session: Session, *, owner_id: int
     ) -> dict[str, tuple[int, str]]:
+        """Map canonical domains to the owner's stores.
+
+        The mapping is rebuilt only when the owner's store count or newest
+        ``updated_at`` changes; store column edits bump ``updated_at`` on flush.
+        """
+
+        version_statement = select(func.max(Store.updated_at), func.count()).where(
+            Store.user_id == owner_id
+        )
+        latest_update, store_count = session.exec(version_statement).one()
+        version = (latest_update, store_count)
+        cached = self._store_lookup_cache.get(owner_id)
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+
         lookup: dict[str, tuple[int, str]] = {}
         stores = session.exec(select(Store).where(Store.user_id == owner_id)).all()
         for store in stores:
@@ -522,7 +573,8 @@ class SearxSearchService:
                 lookup[canonical] = (store.id, store.name)
                 if not canonical.startswith("www."):
                     lookup[f"www.{canonical}"] = (store.id, store.name)
-        return lookup
+        self._store_lookup_cache[owner_id] = (version, lookup)
+        return dict(lookup)
 
     def _build_extra_metadata(
         self, raw_results: list[RawSearchResult]
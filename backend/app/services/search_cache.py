@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any, cast
 
+from sqlalchemy import delete, func
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import Session, select
 
 from app.models import SearchCache
@@ -30,16 +33,14 @@ def prune_search_cache(
     """
 
     cutoff = _normalize_cutoff(before)
-    statement = select(SearchCache).where(SearchCache.expires_at <= cutoff)
-    entries = session.exec(statement).all()
-    removed = len(entries)
-    if dry_run or removed == 0:
-        return removed, cutoff
-
-    for entry in entries:
-        session.delete(entry)
+    expired = cast(InstrumentedAttribute[Any], SearchCache.expires_at) <= cutoff
+    if dry_run:
+        count_statement = select(func.count()).select_from(SearchCache).where(expired)
+        return session.exec(count_statement).one(), cutoff
+
+    result = session.exec(delete(SearchCache).where(expired))
     session.commit()
-    return removed, cutoff
+    return result.rowcount, cutoff
 
 
 __all__ = ["prune_search_cache"]
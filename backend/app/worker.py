@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
+import orjson
 import structlog
 from celery import Celery
 from celery.schedules import crontab, schedule
@@ -41,9 +43,11 @@ _LAST_SCHEDULE_MTIME: float | None = None
 
 
 def _apply_schedule_from_json(path: Path) -> int:
+    return _apply_schedule(orjson.loads(path.read_bytes()))
+
+
+def _apply_schedule(config: Mapping[str, Any]) -> int:
     logger = structlog.get_logger(__name__)
-    with path.open("r", encoding="utf-8") as fh:
-        config = json.load(fh)
     beat_schedule: dict[str, dict] = {}
     for name, entry in config.items():
         if entry.get("enabled") is False:
@@ -89,7 +93,7 @@ def _load_beat_schedule() -> None:
             _LAST_SCHEDULE_MTIME = schedule_path.stat().st_mtime
             logger.info("celery.beat_schedule.loaded", path=str(schedule_path))
             return
-        except (OSError, json.JSONDecodeError, ValueError) as exc:
+        except (OSError, orjson.JSONDecodeError, ValueError) as exc:
             logger.warning("celery.beat_schedule.load_failed", error=str(exc))
 
     # Fallback default: update all products every 6 hours, top of the hour.
@@ -126,7 +130,7 @@ def _watch_schedule_file(interval_seconds: float = 5.0) -> None:
                 if _LAST_SCHEDULE_MTIME is None or mtime > _LAST_SCHEDULE_MTIME:
                     _apply_schedule_from_json(schedule_path)
                     _LAST_SCHEDULE_MTIME = mtime
-        except (OSError, json.JSONDecodeError, ValueError) as exc:
+        except (OSError, orjson.JSONDecodeError, ValueError) as exc:
             logger.warning("celery.beat_schedule.watcher.error", error=str(exc))
         time.sleep(interval_seconds)
 
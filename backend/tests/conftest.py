@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.services.pricing_schedule import clear_pricing_schedule_cache
+
+_MEMORY_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _tuned_memory_engine() -> Engine:
+    """Build an in-memory SQLite engine tuned for fast, savepoint-safe tests.
+
+    ``sqlite://`` memory databases are private to the process that opens them,
+    so every pytest-xdist worker already gets its own database. ``StaticPool``
+    only pins the single connection that keeps that database alive; a
+    shared-cache URI behind ``NullPool`` would drop the schema whenever the
+    last test connection closed and adds table-level locking between sessions.
+    """
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection: Any, _record: Any) -> None:
+        # pysqlite manages transactions on its own and lets a RELEASE of the
+        # outermost SAVEPOINT commit; hand BEGIN back to SQLAlchemy instead.
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _MEMORY_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def reset_pricing_schedule_cache() -> Iterator[None]:
+    try:
+        yield
+    finally:
+        clear_pricing_schedule_cache()
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture() -> Iterator[Engine]:
+    """Create the in-memory schema once per test session.
+
+    Tests should go through the ``session`` fixture so their writes are
+    rolled back instead of leaking into later tests.
+    """
+
+    engine = _tuned_memory_engine()
+    SQLModel.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine: Engine) -> Iterator[Session]:
+    """Yield a session whose work is rolled back when the test finishes.
+
+    Commits issued by the code under test only release a SAVEPOINT, so the
+    outer transaction can discard everything at teardown.
+    """
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
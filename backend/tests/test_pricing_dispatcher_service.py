@@ -48,7 +48,7 @@ def test_queue_product_refresh_returns_dispatch(
             return _ResultStub(task_id="product", status="SUCCESS")
 
     monkeypatch.setattr(
-        "app.services.pricing_dispatcher.update_product_prices_task",
+        "app.tasks.pricing.update_product_prices_task",
         _Task(),
     )
 
@@ -89,7 +89,7 @@ def test_queue_all_refresh_uses_update_all_task(
 
     task = _Task()
     monkeypatch.setattr(
-        "app.services.pricing_dispatcher.update_all_products_task",
+        "app.tasks.pricing.update_all_products_task",
         task,
     )
 
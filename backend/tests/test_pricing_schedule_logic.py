@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from sqlmodel import Session
@@ -19,6 +20,21 @@ from app.services.pricing_schedule import (
     resolve_schedule_path,
 )
 
+pytestmark = pytest.mark.xdist_group("pricing_schedule")
+
+_EMPTY_LAST_RUN_MAP: dict[str, datetime] = {}
+_SAMPLE_LAST_RUN_MAP: dict[str, datetime] = {
+    "pricing.update_all_products": datetime(2024, 1, 1, tzinfo=UTC)
+}
+
+
+def _return_empty_last_runs(_session: Session | None) -> dict[str, datetime]:
+    return _EMPTY_LAST_RUN_MAP
+
+
+def _return_sample_last_runs(_session: Session | None) -> dict[str, datetime]:
+    return _SAMPLE_LAST_RUN_MAP
+
 
 def test_resolve_schedule_path_handles_relative() -> None:
     relative = "configs/schedule.json"
@@ -49,9 +65,7 @@ def test_describe_pricing_schedule_uses_default_when_file_missing(
     settings.celery_beat_schedule_path = "missing.json"
     monkeypatch.setattr(
         "app.services.pricing_schedule.fetch_last_run_map",
-        lambda session: {
-            "pricing.update_all_products": datetime(2024, 1, 1, tzinfo=UTC)
-        },
+        _return_sample_last_runs,
     )
     now_value = datetime(2024, 1, 1, 12, tzinfo=UTC)
     try:
@@ -77,7 +91,7 @@ def test_describe_pricing_schedule_handles_invalid_json(
     settings.celery_beat_schedule_path = str(schedule_path)
     monkeypatch.setattr(
         "app.services.pricing_schedule.fetch_last_run_map",
-        lambda session: {},
+        _return_empty_last_runs,
     )
     try:
         descriptions = describe_pricing_schedule(session=None, now=datetime.now(UTC))
@@ -86,6 +100,40 @@ def test_describe_pricing_schedule_handles_invalid_json(
     assert any(item["task"] == "pricing.update_all_products" for item in descriptions)
 
 
+def test_describe_pricing_schedule_reuses_parsed_schedule_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    schedule_path = tmp_path / "schedule.json"
+    schedule_path.write_text(
+        json.dumps({"pricing.update_all_products": {"schedule": 30}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(settings, "celery_beat_schedule_path", str(schedule_path))
+    loaded: list[Path] = []
+    original = pricing_schedule.load_schedule_mapping
+
+    def _counting_load(path: Path) -> dict[str, dict[str, Any]]:
+        loaded.append(path)
+        return original(path)
+
+    monkeypatch.setattr(pricing_schedule, "load_schedule_mapping", _counting_load)
+    now_value = datetime(2025, 9, 27, 9, 0, 5, tzinfo=UTC)
+
+    first = describe_pricing_schedule(None, now=now_value)
+    first[0]["kwargs"]["mutated"] = True
+    later = now_value + timedelta(seconds=40)
+    second = describe_pricing_schedule(None, now=later)
+    assert loaded == [schedule_path]
+    assert second[0]["kwargs"] == {}
+    assert first[0]["next_run_at"] == now_value + timedelta(seconds=30)
+    assert second[0]["next_run_at"] == later + timedelta(seconds=30)
+
+    stat = schedule_path.stat()
+    os.utime(schedule_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    describe_pricing_schedule(None, now=now_value)
+    assert len(loaded) == 2
+
+
 def test_estimate_next_run_supports_multiple_schedule_formats() -> None:
     now_value = datetime(2024, 1, 1, 12, tzinfo=UTC)
     last_run = datetime(2024, 1, 1, 11, 30, tzinfo=UTC)
@@ -6,9 +6,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
-from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session
 
 from app.core.config import settings
 from app.models import AppSetting
@@ -17,19 +15,7 @@ from app.services.pricing_schedule import (
     estimate_schedule_interval,
 )
 
-
-@pytest.fixture(name="engine")
-def engine_fixture() -> Iterator[Engine]:
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    try:
-        yield engine
-    finally:
-        engine.dispose()
+pytestmark = pytest.mark.xdist_group("schedule_db")
 
 
 @pytest.fixture(autouse=True)
@@ -41,7 +27,7 @@ def restore_schedule_path() -> Iterator[None]:
         settings.celery_beat_schedule_path = previous
 
 
-def test_describe_pricing_schedule_interval(engine: Engine, tmp_path: Path) -> None:
+def test_describe_pricing_schedule_interval(session: Session, tmp_path: Path) -> None:
     schedule_path = tmp_path / "schedule.json"
     schedule_path.write_text(
         json.dumps(
@@ -59,15 +45,14 @@ def test_describe_pricing_schedule_interval(engine: Engine, tmp_path: Path) -> N
 
     reference = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
 
-    with Session(engine) as session:
-        session.add(
-            AppSetting(
-                key="schedule.last_run.pricing.update_all_products",
-                value="2025-09-27T08:00:00+00:00",
-            )
+    session.add(
+        AppSetting(
+            key="schedule.last_run.pricing.update_all_products",
+            value="2025-09-27T08:00:00+00:00",
         )
-        session.commit()
-        entries = describe_pricing_schedule(session, now=reference)
+    )
+    session.commit()
+    entries = describe_pricing_schedule(session, now=reference)
 
     assert len(entries) == 1
     entry = entries[0]
@@ -75,7 +60,7 @@ def test_describe_pricing_schedule_interval(engine: Engine, tmp_path: Path) -> N
     assert entry["next_run_at"] == datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
 
 
-def test_describe_pricing_schedule_cron_fields(engine: Engine, tmp_path: Path) -> None:
+def test_describe_pricing_schedule_cron_fields(tmp_path: Path) -> None:
     schedule_path = tmp_path / "cron_schedule.json"
     schedule_path.write_text(
         json.dumps(
@@ -101,33 +86,27 @@ def test_describe_pricing_schedule_cron_fields(engine: Engine, tmp_path: Path) -
 
 
 def test_describe_pricing_schedule_handles_invalid_json(
-    engine: Engine, tmp_path: Path
+    session: Session, tmp_path: Path
 ) -> None:
     schedule_path = tmp_path / "invalid.json"
     schedule_path.write_text("[]", encoding="utf-8")
     settings.celery_beat_schedule_path = str(schedule_path)
 
-    with Session(engine) as session:
-        entries = describe_pricing_schedule(
-            session, now=datetime(2025, 9, 27, tzinfo=UTC)
-        )
+    entries = describe_pricing_schedule(session, now=datetime(2025, 9, 27, tzinfo=UTC))
 
     assert entries
     assert entries[0]["name"] == "pricing.update_all_products"
     assert entries[0]["enabled"] is True
     assert entries[0]["next_run_at"] is not None
 
-    with Session(engine) as session:
-        session.add(
-            AppSetting(
-                key="schedule.last_run.pricing.update_all_products",
-                value="invalid",
-            )
-        )
-        session.commit()
-        entries = describe_pricing_schedule(
-            session, now=datetime(2025, 9, 27, tzinfo=UTC)
+    session.add(
+        AppSetting(
+            key="schedule.last_run.pricing.update_all_products",
+            value="invalid",
         )
+    )
+    session.commit()
+    entries = describe_pricing_schedule(session, now=datetime(2025, 9, 27, tzinfo=UTC))
 
     assert entries[0]["last_run_at"] is None
 
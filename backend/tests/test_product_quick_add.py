@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from app.models import Store
 from app.services.product_quick_add import (
+    _HTML_MEMO_SIZE,
     _auto_detect_strategy_fields,
     _build_scrape_strategy,
     _build_store_domains,
     _coerce_price,
     _derive_store_name,
     _derive_store_slug,
+    _detect_strategy_fields_cached,
     _extract_price_currency_from_ld_json,
+    _HtmlMemo,
     _merge_store_domains,
+    _normalise_host,
     _parse_scraper_payload,
 )
 
+_SELECTOR_HTML = """
+    <html>
+        <head>
+            <meta property=\"og:title\" content=\"Sample Gadget\" />
+            <meta property=\"product:price:amount\" content=\"249.99\" />
+            <meta property=\"og:image\" content=\"https://example.com/gadget.png\" />
+        </head>
+        <body>
+            <span class=\"price\">$249.99</span>
+        </body>
+    </html>
+    """
+
+_LD_JSON_HTML = """
+    <html>
+        <head>
+            <script type=\"application/ld+json\">
+            {
+                \"@context\": \"https://schema.org\",
+                \"offers\": {
+                    \"price\": \"499.95\",
+                    \"priceCurrency\": \"eur\"
+                }
+            }
+            </script>
+        </head>
+    </html>
+    """
+
 
 def test_store_slug_and_domain_helpers_normalize_hosts() -> None:
     assert _derive_store_slug("www.Example-Shop.com") == "example-shop-com"
@@ -35,22 +70,21 @@ def test_store_slug_and_domain_helpers_normalize_hosts() -> None:
     changed = _merge_store_domains(store, "shop.example-shop.com")
     assert changed is True
     assert any(entry["domain"] == "shop.example-shop.com" for entry in store.domains)
+    assert _merge_store_domains(store, "SHOP.example-shop.com:443") is False
+
+
+def test_normalise_host_is_cached_per_raw_host() -> None:
+    first = _normalise_host("www.Cached-Store.com:8080")
+    hits_before = _normalise_host.cache_info().hits
+
+    assert _derive_store_slug("www.Cached-Store.com:8080") == first.slug
+    assert _derive_store_name("www.Cached-Store.com:8080") == "Cached Store"
+    assert _normalise_host.cache_info().hits == hits_before + 2
+    assert first.domains == ("cached-store.com", "www.cached-store.com")
 
 
 def test_auto_detect_strategy_fields_prefers_selectors() -> None:
-    html = """
-    <html>
-        <head>
-            <meta property=\"og:title\" content=\"Sample Gadget\" />
-            <meta property=\"product:price:amount\" content=\"249.99\" />
-            <meta property=\"og:image\" content=\"https://example.com/gadget.png\" />
-        </head>
-        <body>
-            <span class=\"price\">$249.99</span>
-        </body>
-    </html>
-    """
-    detected = _auto_detect_strategy_fields(html)
+    detected = _auto_detect_strategy_fields(_SELECTOR_HTML)
     assert set(detected) == {"title", "price", "image"}
     assert detected["title"].type == "css"
     assert detected["price"].data == "249.99"
@@ -59,6 +93,54 @@ def test_auto_detect_strategy_fields_prefers_selectors() -> None:
     assert image_data.endswith("gadget.png")
 
 
+def test_auto_detect_strategy_fields_reuses_parsed_html() -> None:
+    first = _auto_detect_strategy_fields(_SELECTOR_HTML)
+    hits_before = _detect_strategy_fields_cached.hits
+    first["title"].data = "Mutated"
+
+    second = _auto_detect_strategy_fields(_SELECTOR_HTML)
+
+    assert _detect_strategy_fields_cached.hits == hits_before + 1
+    assert second["title"].data == "Sample Gadget"
+    assert second["title"] is not first["title"]
+
+
+def test_html_memo_evicts_least_recently_used_page() -> None:
+    calls: list[str] = []
+
+    def _length(html: str) -> int:
+        calls.append(html)
+        return len(html)
+
+    memo = _HtmlMemo(_length)
+    pages = [f"<html>{index}</html>" for index in range(_HTML_MEMO_SIZE + 1)]
+    for page in pages:
+        assert memo(page) == len(page)
+    assert memo(pages[-1]) == len(pages[-1])
+    assert memo.hits == 1
+
+    for page in pages[1:]:
+        memo(page)
+    assert memo.hits == _HTML_MEMO_SIZE + 1
+    assert calls.count(pages[0]) == 1
+
+    memo(pages[0])
+    assert calls.count(pages[0]) == 2
+
+    memo.cache_clear()
+    assert memo.hits == 0
+
+
+def test_html_memo_is_safe_across_threads() -> None:
+    memo = _HtmlMemo(len)
+    pages = [f"<html>{index}</html>" for index in range(_HTML_MEMO_SIZE * 4)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(memo, pages * 8))
+
+    assert results == [len(page) for page in pages * 8]
+
+
 def test_build_scrape_strategy_uses_payload_and_fallbacks() -> None:
     metadata = {
         "title": "Widget",
@@ -100,21 +182,6 @@ def test_parse_scraper_payload_combines_sources() -> None:
 
 
 def test_extract_price_currency_from_ld_json_handles_nested_offers() -> None:
-    html = """
-    <html>
-        <head>
-            <script type=\"application/ld+json\">
-            {
-                \"@context\": \"https://schema.org\",
-                \"offers\": {
-                    \"price\": \"499.95\",
-                    \"priceCurrency\": \"eur\"
-                }
-            }
-            </script>
-        </head>
-    </html>
-    """
-    price, currency = _extract_price_currency_from_ld_json(html)
+    price, currency = _extract_price_currency_from_ld_json(_LD_JSON_HTML)
     assert price == "499.95"
     assert currency == "EUR"
@@ -6,9 +6,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
-from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session
 
 import app.models as models
 from app.core.config import settings
@@ -18,19 +16,16 @@ from app.services.schedule_health import (
     format_alert_summary,
 )
 
+pytestmark = pytest.mark.xdist_group("schedule_db")
 
-@pytest.fixture(name="engine")
-def engine_fixture() -> Iterator[Engine]:
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    try:
-        yield engine
-    finally:
-        engine.dispose()
+_SCHEDULE_3600_BYTES = json.dumps(
+    {
+        "pricing.update_all_products": {
+            "task": "pricing.update_all_products",
+            "schedule": 3600,
+        }
+    }
+).encode()
 
 
 @pytest.fixture(autouse=True)
@@ -42,39 +37,30 @@ def restore_schedule_path() -> Iterator[None]:
         settings.celery_beat_schedule_path = previous
 
 
-def _write_schedule(tmp_path: Path, schedule: dict[str, dict[str, object]]) -> Path:
+def _write_schedule(tmp_path: Path) -> Path:
     schedule_path = tmp_path / "schedule.json"
-    schedule_path.write_text(json.dumps(schedule), encoding="utf-8")
+    schedule_path.write_bytes(_SCHEDULE_3600_BYTES)
     settings.celery_beat_schedule_path = str(schedule_path)
     return schedule_path
 
 
 def test_detect_alerts_returns_alert_when_interval_exceeded(
-    engine: Engine, tmp_path: Path
+    session: Session, tmp_path: Path
 ) -> None:
-    _write_schedule(
-        tmp_path,
-        {
-            "pricing.update_all_products": {
-                "task": "pricing.update_all_products",
-                "schedule": 3600,
-            }
-        },
-    )
+    _write_schedule(tmp_path)
 
-    with Session(engine) as session:
-        session.add(
-            AppSetting(
-                key="schedule.last_run.pricing.update_all_products",
-                value="2025-09-27T08:00:00+00:00",
-            )
+    session.add(
+        AppSetting(
+            key="schedule.last_run.pricing.update_all_products",
+            value="2025-09-27T08:00:00+00:00",
         )
-        session.commit()
+    )
+    session.commit()
 
-        service = ScheduleHealthService()
-        alerts = service.detect_alerts(
-            session, now=datetime(2025, 9, 27, 12, 0, tzinfo=UTC)
-        )
+    service = ScheduleHealthService()
+    alerts = service.detect_alerts(
+        session, now=datetime(2025, 9, 27, 12, 0, tzinfo=UTC)
+    )
 
     assert len(alerts) == 1
     alert = alerts[0]
@@ -83,93 +69,66 @@ def test_detect_alerts_returns_alert_when_interval_exceeded(
     assert alert.overdue.total_seconds() > 0
 
 
-def test_detect_alerts_skips_recent_runs(engine: Engine, tmp_path: Path) -> None:
-    _write_schedule(
-        tmp_path,
-        {
-            "pricing.update_all_products": {
-                "task": "pricing.update_all_products",
-                "schedule": 3600,
-            }
-        },
-    )
+def test_detect_alerts_skips_recent_runs(session: Session, tmp_path: Path) -> None:
+    _write_schedule(tmp_path)
 
-    with Session(engine) as session:
-        session.add(
-            AppSetting(
-                key="schedule.last_run.pricing.update_all_products",
-                value="2025-09-27T10:30:00+00:00",
-            )
+    session.add(
+        AppSetting(
+            key="schedule.last_run.pricing.update_all_products",
+            value="2025-09-27T10:30:00+00:00",
         )
-        session.commit()
+    )
+    session.commit()
 
-        service = ScheduleHealthService()
-        alerts = service.detect_alerts(
-            session, now=datetime(2025, 9, 27, 11, 0, tzinfo=UTC)
-        )
+    service = ScheduleHealthService()
+    alerts = service.detect_alerts(
+        session, now=datetime(2025, 9, 27, 11, 0, tzinfo=UTC)
+    )
 
     assert alerts == []
 
 
 def test_list_operator_recipients_includes_superusers_and_admins(
-    engine: Engine, tmp_path: Path
+    session: Session, tmp_path: Path
 ) -> None:
-    _write_schedule(
-        tmp_path,
-        {
-            "pricing.update_all_products": {
-                "task": "pricing.update_all_products",
-                "schedule": 3600,
-            }
-        },
-    )
+    _write_schedule(tmp_path)
 
-    with Session(engine) as session:
-        admin_role = models.Role(slug="admin", name="Admin")
-        session.add(admin_role)
-        session.commit()
-        session.refresh(admin_role)
+    admin_role = models.Role(slug="admin", name="Admin")
+    session.add(admin_role)
+    session.commit()
+    session.refresh(admin_role)
 
-        superuser = models.User(email="super@example.com", is_superuser=True)
-        admin = models.User(email="admin@example.com", is_superuser=False)
-        normal = models.User(email="user@example.com", is_superuser=False)
-        session.add_all([superuser, admin, normal])
-        session.commit()
+    superuser = models.User(email="super@example.com", is_superuser=True)
+    admin = models.User(email="admin@example.com", is_superuser=False)
+    normal = models.User(email="user@example.com", is_superuser=False)
+    session.add_all([superuser, admin, normal])
+    session.commit()
 
-        session.add(models.UserRoleAssignment(user_id=admin.id, role_id=admin_role.id))
-        session.commit()
+    session.add(models.UserRoleAssignment(user_id=admin.id, role_id=admin_role.id))
+    session.commit()
 
-        service = ScheduleHealthService()
-        recipients = service.list_operator_recipients(session)
+    service = ScheduleHealthService()
+    recipients = service.list_operator_recipients(session)
 
     emails = {user.email for user in recipients}
     assert emails == {"super@example.com", "admin@example.com"}
 
 
-def test_format_alert_summary(engine: Engine, tmp_path: Path) -> None:
-    _write_schedule(
-        tmp_path,
-        {
-            "pricing.update_all_products": {
-                "task": "pricing.update_all_products",
-                "schedule": 3600,
-            }
-        },
-    )
+def test_format_alert_summary(session: Session, tmp_path: Path) -> None:
+    _write_schedule(tmp_path)
 
-    with Session(engine) as session:
-        session.add(
-            AppSetting(
-                key="schedule.last_run.pricing.update_all_products",
-                value="2025-09-27T08:00:00+00:00",
-            )
+    session.add(
+        AppSetting(
+            key="schedule.last_run.pricing.update_all_products",
+            value="2025-09-27T08:00:00+00:00",
         )
-        session.commit()
+    )
+    session.commit()
 
-        service = ScheduleHealthService()
-        alerts = service.detect_alerts(
-            session, now=datetime(2025, 9, 27, 12, 0, tzinfo=UTC)
-        )
+    service = ScheduleHealthService()
+    alerts = service.detect_alerts(
+        session, now=datetime(2025, 9, 27, 12, 0, tzinfo=UTC)
+    )
 
     summary = format_alert_summary(alerts)
     assert "pricing.update_all_products" in summary
@@ -2,87 +2,63 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session
 
 from app.models import AppSetting
+from app.services import schedule_tracker
 from app.services.schedule_tracker import fetch_last_run_map, record_schedule_run
 
 
-def _make_engine() -> Engine:
-    return create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+def test_record_schedule_run_persists_value(session: Session) -> None:
+    reference = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
+    record_schedule_run(session, "pricing.update_all_products", timestamp=reference)
+    session.expire_all()
+
+    stored = session.get(AppSetting, "schedule.last_run.pricing.update_all_products")
+    assert stored is not None
+    assert stored.value == "2025-09-27T09:00:00+00:00"
 
 
-def test_record_schedule_run_persists_value() -> None:
-    engine = _make_engine()
-    SQLModel.metadata.create_all(engine)
-    try:
-        reference = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
-        with Session(engine) as session:
-            record_schedule_run(
-                session, "pricing.update_all_products", timestamp=reference
-            )
+def test_fetch_last_run_map_handles_invalid_values(session: Session) -> None:
+    session.add(
+        AppSetting(
+            key="schedule.last_run.pricing.update_all_products",
+            value="2025-09-27T09:00:00+00:00",
+        )
+    )
+    session.add(
+        AppSetting(
+            key="schedule.last_run.invalid",
+            value="not-a-timestamp",
+        )
+    )
+    session.add(
+        AppSetting(key="schedule.lastXrun.other", value="2025-09-27T09:00:00+00:00")
+    )
+    session.commit()
 
-        with Session(engine) as session:
-            stored = session.get(
-                AppSetting, "schedule.last_run.pricing.update_all_products"
-            )
-            assert stored is not None
-            assert stored.value == "2025-09-27T09:00:00+00:00"
-    finally:
-        engine.dispose()
+    mapping = fetch_last_run_map(session)
+    assert list(mapping.keys()) == ["pricing.update_all_products"]
+    assert mapping["pricing.update_all_products"] == datetime(
+        2025, 9, 27, 9, 0, tzinfo=UTC
+    )
 
 
-def test_fetch_last_run_map_handles_invalid_values() -> None:
-    engine = _make_engine()
-    SQLModel.metadata.create_all(engine)
-    try:
-        with Session(engine) as session:
-            session.add(
-                AppSetting(
-                    key="schedule.last_run.pricing.update_all_products",
-                    value="2025-09-27T09:00:00+00:00",
-                )
-            )
-            session.add(
-                AppSetting(
-                    key="schedule.last_run.invalid",
-                    value="not-a-timestamp",
-                )
-            )
-            session.commit()
+def test_fetch_last_run_map_seeks_key_index(session: Session) -> None:
+    connection = session.connection()
+    compiled = schedule_tracker._LAST_RUN_STATEMENT.compile(connection)
+    params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+    details = " ".join(str(row[-1]) for row in plan)
+    assert details.startswith("SEARCH app_settings USING INDEX")
 
-        with Session(engine) as session:
-            mapping = fetch_last_run_map(session)
-            assert list(mapping.keys()) == ["pricing.update_all_products"]
-            assert mapping["pricing.update_all_products"] == datetime(
-                2025, 9, 27, 9, 0, tzinfo=UTC
-            )
-    finally:
-        engine.dispose()
 
+def test_record_schedule_run_updates_existing(session: Session) -> None:
+    initial = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
+    updated = initial + timedelta(hours=6)
+    record_schedule_run(session, "pricing.update_all_products", timestamp=initial)
+    record_schedule_run(session, "pricing.update_all_products", timestamp=updated)
+    session.expire_all()
 
-def test_record_schedule_run_updates_existing() -> None:
-    engine = _make_engine()
-    SQLModel.metadata.create_all(engine)
-    try:
-        initial = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
-        updated = initial + timedelta(hours=6)
-        with Session(engine) as session:
-            record_schedule_run(
-                session, "pricing.update_all_products", timestamp=initial
-            )
-        with Session(engine) as session:
-            record_schedule_run(
-                session, "pricing.update_all_products", timestamp=updated
-            )
-        with Session(engine) as session:
-            mapping = fetch_last_run_map(session)
-            assert mapping["pricing.update_all_products"] == updated
-    finally:
-        engine.dispose()
+    mapping = fetch_last_run_map(session)
+    assert mapping["pricing.update_all_products"] == updated
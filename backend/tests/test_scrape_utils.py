@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import re
+
+import pytest
 from bs4 import BeautifulSoup
+from soupsieve import SelectorSyntaxError
 
+from app.services import scrape_utils
 from app.services.scrape_utils import (
     extract_element_value,
     extract_with_css,
@@ -42,6 +47,11 @@ def test_normalize_price_string_handles_locale_variants() -> None:
     assert normalize_price_string("invalid") is None
 
 
+def test_normalize_price_string_uses_precompiled_pattern() -> None:
+    assert isinstance(scrape_utils._PRICE_NUMBER_RE, re.Pattern)
+    assert scrape_utils._search_price_number("$1,299.00") is not None
+
+
 def test_normalize_strategy_data_returns_trimmed_value() -> None:
     assert normalize_strategy_data("title", "  Sample Product  ") == "Sample Product"
     assert normalize_strategy_data("price", "£ 1,299.00") == "1299"
@@ -67,7 +77,117 @@ def test_extract_with_css_returns_first_valid_match() -> None:
     assert missing is None
 
 
+@pytest.mark.parametrize("selector", ["p.price", "div > p.price"])
+def test_extract_with_css_closes_implied_tags_like_a_browser(selector: str) -> None:
+    # lxml ends the first paragraph at the second <p>; html.parser would nest
+    # them and read both prices as "$5.00$6.00".
+    html = '<div><p class="price">$5.00<p class="price">$6.00</div>'
+
+    assert extract_with_css(html, selector, None, "price") == "5"
+
+
+_PRODUCT_HTML = """
+<html>
+    <head><meta property="og:title" content="Sample Gadget" /></head>
+    <body>
+        <div id="product" class="product">
+            <span class="label price">Was</span>
+            <span class="sale price" data-amount="1099">$10.99</span>
+        </div>
+    </body>
+</html>
+"""
+
+
+@pytest.mark.parametrize(
+    ("simple", "compound", "attr", "field", "expected"),
+    [
+        ("span.price", "div#product > span.price", "data-amount", "price", "1099"),
+        ("span.price", "div.product span.price", None, "price", "10.99"),
+        (
+            "meta[property]",
+            'head > meta[property="og:title"]',
+            "content",
+            "title",
+            "Sample Gadget",
+        ),
+        ("#product", "body > div.product", None, "title", "Was$10.99"),
+    ],
+)
+def test_extract_with_css_simple_selectors_match_css_engine(
+    simple: str, compound: str, attr: str | None, field: str, expected: str
+) -> None:
+    assert scrape_utils._parse_simple_selector(simple) is not None
+    assert scrape_utils._parse_simple_selector(compound) is None
+
+    assert extract_with_css(_PRODUCT_HTML, simple, attr, field) == expected
+    assert extract_with_css(_PRODUCT_HTML, compound, attr, field) == expected
+
+
+_ATTRIBUTE_HTML = """
+<div>
+    <span id="a" class="sale">Sale</span>
+    <span id="b" class="price sale">Price</span>
+    <span class="price">Plain</span>
+    <span data-empty="">Empty</span>
+    <input type="Text" data-x="Foo Bar" value="typed" />
+</div>
+"""
+
+
+@pytest.mark.parametrize(
+    ("selector", "fast_path"),
+    [
+        ("span.sale", True),
+        ("span#a", True),
+        ("span[data-empty]", True),
+        ("span.sale[class]", False),
+        ("span#a[id]", False),
+        ("span#b[id=a]", False),
+        ("span.price[class=sale]", False),
+        ("span[class=price]", False),
+        ('span[data-empty=""]', False),
+        ("input[type]", True),
+        ("input[type=text]", False),
+        ('input[type="TEXT"]', False),
+        ('[data-x="Foo Bar"]', False),
+        ("span._a-b", True),
+    ],
+)
+def test_select_nodes_matches_css_engine(selector: str, fast_path: bool) -> None:
+    assert (scrape_utils._parse_simple_selector(selector) is not None) is fast_path
+
+    expected = BeautifulSoup(_ATTRIBUTE_HTML, "lxml").select(selector)
+    selected = scrape_utils._select_nodes(_ATTRIBUTE_HTML, selector)
+    assert [str(node) for node in selected] == [str(node) for node in expected]
+
+
+@pytest.mark.parametrize(
+    "selector", ["#1ab", "span.-1x", "[data-x=Foo Bar]", "span[1ab]"]
+)
+def test_select_nodes_rejects_selectors_the_css_engine_rejects(selector: str) -> None:
+    assert scrape_utils._parse_simple_selector(selector) is None
+
+    with pytest.raises(SelectorSyntaxError):
+        BeautifulSoup(_ATTRIBUTE_HTML, "lxml").select(selector)
+    with pytest.raises(SelectorSyntaxError):
+        scrape_utils._select_nodes(_ATTRIBUTE_HTML, selector)
+
+
 def test_extract_with_regex_handles_invalid_patterns() -> None:
     html = '<span class="price">Price: $42.99</span>'
     assert extract_with_regex(html, r"Price: \$(\d+\.\d+)", "price") == "42.99"
     assert extract_with_regex(html, r"Price: \\$(\\d+", "price") is None
+
+
+def test_extract_with_regex_reuses_compiled_patterns() -> None:
+    html = '<span class="price">PRICE: $42.99</span>'
+    pattern = r"price: \$(\d+\.\d+)"
+    assert extract_with_regex(html, pattern, "price") == "42.99"
+    hits_before = scrape_utils._compile_strategy_pattern.cache_info().hits
+
+    assert extract_with_regex(html, pattern, "price") == "42.99"
+    assert extract_with_regex(html, r"(unclosed", "price") is None
+    assert extract_with_regex(html, r"(unclosed", "price") is None
+
+    assert scrape_utils._compile_strategy_pattern.cache_info().hits == hits_before + 2
@@ -1,96 +1,105 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
-import pytest
-from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlalchemy import event, func, insert
+from sqlmodel import Session, select
 
 from app.models import SearchCache
 from app.services.search_cache import prune_search_cache
 
 
-@pytest.fixture(name="engine")
-def engine_fixture() -> Iterator[Engine]:
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    try:
-        yield engine
-    finally:
-        engine.dispose()
-
-
-def _insert_cache(
-    session: Session,
-    *,
-    query_hash: str,
-    expires_at: datetime,
-) -> None:
-    entry = SearchCache(
-        query_hash=query_hash,
-        query="test",
-        response={},
-        expires_at=expires_at,
+def _insert_cache(session: Session, expires_by_hash: dict[str, datetime]) -> None:
+    now = datetime.now(UTC)
+    session.exec(
+        insert(SearchCache).values(
+            [
+                {
+                    "query_hash": query_hash,
+                    "query": "test",
+                    "response": {},
+                    "expires_at": expires_at,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for query_hash, expires_at in expires_by_hash.items()
+            ]
+        )
     )
-    session.add(entry)
 
 
-def test_prune_search_cache_removes_expired_rows(engine: Engine) -> None:
+def test_prune_search_cache_removes_expired_rows(session: Session) -> None:
     now = datetime.now(UTC)
-    with Session(engine) as session:
-        _insert_cache(
-            session, query_hash="expired-1", expires_at=now - timedelta(hours=2)
-        )
-        _insert_cache(
-            session, query_hash="expired-2", expires_at=now - timedelta(days=1)
-        )
-        _insert_cache(session, query_hash="future", expires_at=now + timedelta(days=1))
-        session.commit()
+    _insert_cache(
+        session,
+        {
+            "expired-1": now - timedelta(hours=2),
+            "expired-2": now - timedelta(days=1),
+            "future": now + timedelta(days=1),
+        },
+    )
+    session.commit()
 
-        removed, cutoff = prune_search_cache(session)
-        assert removed == 2
-        assert cutoff.tzinfo is UTC
+    removed, cutoff = prune_search_cache(session)
+    assert removed == 2
+    assert cutoff.tzinfo is UTC
 
-    with Session(engine) as session:
-        remaining = session.exec(select(SearchCache)).all()
-        assert len(remaining) == 1
-        assert remaining[0].query_hash == "future"
+    remaining = session.exec(select(SearchCache.query_hash)).all()
+    assert remaining == ["future"]
 
 
-def test_prune_search_cache_dry_run_keeps_rows(engine: Engine) -> None:
+def test_prune_search_cache_dry_run_keeps_rows(session: Session) -> None:
     now = datetime.now(UTC)
-    with Session(engine) as session:
-        _insert_cache(
-            session, query_hash="expired", expires_at=now - timedelta(hours=6)
-        )
-        _insert_cache(session, query_hash="future", expires_at=now + timedelta(hours=6))
-        session.commit()
+    _insert_cache(
+        session,
+        {"expired": now - timedelta(hours=6), "future": now + timedelta(hours=6)},
+    )
+    session.commit()
 
-        removed, _ = prune_search_cache(session, dry_run=True)
-        assert removed == 1
+    removed, _ = prune_search_cache(session, dry_run=True)
+    assert removed == 1
 
-    with Session(engine) as session:
-        total = session.exec(select(SearchCache)).all()
-        assert len(total) == 2
+    total = session.exec(select(func.count()).select_from(SearchCache)).one()
+    assert total == 2
 
 
-def test_prune_search_cache_honours_custom_cutoff(engine: Engine) -> None:
+def test_prune_search_cache_honours_custom_cutoff(session: Session) -> None:
     now = datetime.now(UTC)
-    with Session(engine) as session:
-        _insert_cache(session, query_hash="old", expires_at=now - timedelta(days=5))
-        _insert_cache(session, query_hash="recent", expires_at=now - timedelta(days=1))
-        session.commit()
-
-        cutoff = now - timedelta(days=3)
-        removed, _ = prune_search_cache(session, before=cutoff)
-        assert removed == 1
-
-    with Session(engine) as session:
-        hashes = {row.query_hash for row in session.exec(select(SearchCache)).all()}
-        assert hashes == {"recent"}
+    _insert_cache(
+        session,
+        {"old": now - timedelta(days=5), "recent": now - timedelta(days=1)},
+    )
+    session.commit()
+
+    cutoff = now - timedelta(days=3)
+    removed, _ = prune_search_cache(session, before=cutoff)
+    assert removed == 1
+
+    hashes = set(session.exec(select(SearchCache.query_hash)).all())
+    assert hashes == {"recent"}
+
+
+def test_prune_search_cache_delete_uses_expires_at_index(session: Session) -> None:
+    emitted: list[tuple[str, Any]] = []
+
+    def _record(
+        _conn: Any, _cursor: Any, statement: str, parameters: Any, *_args: Any
+    ) -> None:
+        if statement.lstrip().upper().startswith("DELETE"):
+            emitted.append((statement, parameters))
+
+    connection = session.connection()
+    event.listen(connection.engine, "before_cursor_execute", _record)
+    try:
+        prune_search_cache(session, before=datetime(2025, 1, 1, tzinfo=UTC))
+    finally:
+        event.remove(connection.engine, "before_cursor_execute", _record)
+
+    assert len(emitted) == 1
+    statement, parameters = emitted[0]
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "SEARCH search_cache USING INDEX ix_search_cache_expires_at" in details
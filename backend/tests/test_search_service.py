@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Iterator
-from datetime import timedelta
-from typing import Any, cast
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
+from itertools import count
+from typing import Any, NamedTuple, cast
 
 import httpx
+import orjson
 import pytest
 from fastapi import HTTPException
-from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlalchemy import event
+from sqlmodel import Session, select
 
 import app.models as models
 from app.core.config import Settings
@@ -22,25 +24,16 @@ from app.services.search import (
 )
 
 
-@pytest.fixture(name="engine")
-def engine_fixture() -> Iterator[Any]:
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    try:
-        yield engine
-    finally:
-        engine.dispose()
+class Call(NamedTuple):
+    url: str
+    params: dict[str, Any]
+    timeout: httpx.Timeout
+    headers: dict[str, Any] | None
 
 
 class FakeHttpClient:
-    def __init__(
-        self, responses: list[dict[str, Any]], calls: list[dict[str, Any]]
-    ) -> None:
-        self._responses = list(responses)
+    def __init__(self, responses: list[dict[str, Any]], calls: list[Call]) -> None:
+        self._responses = deque(responses)
         self.calls = calls
 
     def __enter__(self) -> HttpClient:
@@ -62,12 +55,10 @@ class FakeHttpClient:
         timeout: httpx.Timeout,
         headers: dict[str, Any] | None = None,
     ) -> httpx.Response:
-        self.calls.append(
-            {"url": url, "params": params, "timeout": timeout, "headers": headers}
-        )
+        self.calls.append(Call(url, params, timeout, headers))
         if not self._responses:
             raise AssertionError("Unexpected HTTP call")
-        payload = self._responses.pop(0)
+        payload = self._responses.popleft()
         request = httpx.Request("GET", url, params=params)
         return httpx.Response(status_code=200, json=payload, request=request)
 
@@ -98,21 +89,26 @@ class ErrorHttpClient:
         raise self._error
 
 
+_fixture_ids = count()
+
+
+def _next_id() -> str:
+    return f"t{next(_fixture_ids)}"
+
+
 def _persist_user_with_store(session: Session) -> models.User:
-    user = models.User(email=f"search-{uuid4().hex}@example.com")
+    user = models.User(email=f"search-{_next_id()}@example.com")
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    session.flush()
 
     store = models.Store(
         user_id=user.id,
         name="Example Store",
-        slug=f"example-store-{uuid4().hex[:6]}",
+        slug=f"example-store-{_next_id()}",
         domains=[{"domain": "example.com"}],
     )
     session.add(store)
     session.commit()
-    session.refresh(store)
     return user
 
 
@@ -131,8 +127,7 @@ def _create_product_with_url(
         is_active=True,
     )
     session.add(product)
-    session.commit()
-    session.refresh(product)
+    session.flush()
 
     product_url = models.ProductURL(
         product_id=product.id,
@@ -143,7 +138,6 @@ def _create_product_with_url(
     )
     session.add(product_url)
     session.commit()
-    session.refresh(product_url)
     return product
 
 
@@ -155,7 +149,30 @@ def _build_service(
     return SearxSearchService(settings_obj=settings, http_client_factory=http_factory)
 
 
-def test_service_fetches_and_caches_results(engine: Any) -> None:
+def _unused_http_client(timeout: httpx.Timeout) -> HttpClient:
+    return ErrorHttpClient(RuntimeError("unused"))
+
+
+@pytest.fixture(scope="module")
+def default_service() -> SearxSearchService:
+    """Service for tests that never reach SearXNG."""
+
+    return _build_service(
+        settings=Settings(searxng_url="https://searx"),
+        http_factory=_unused_http_client,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_store_lookup_cache(
+    default_service: SearxSearchService,
+) -> Iterator[None]:
+    # Each test gets a fresh database, so owner ids and store versions repeat.
+    yield
+    default_service._store_lookup_cache.clear()
+
+
+def test_service_fetches_and_caches_results(session: Session) -> None:
     responses = [
         {
             "results": [
@@ -176,7 +193,7 @@ def test_service_fetches_and_caches_results(engine: Any) -> None:
             ]
         }
     ]
-    calls: list[dict[str, Any]] = []
+    calls: list[Call] = []
 
     def factory(timeout: httpx.Timeout) -> HttpClient:
         return FakeHttpClient(responses, calls)
@@ -187,32 +204,33 @@ def test_service_fetches_and_caches_results(engine: Any) -> None:
     )
     service = _build_service(settings=service_settings, http_factory=factory)
 
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        response = service.search(session, query="noise cancelling", owner=user)
-
-        assert response.cache_hit is False
-        assert response.query.startswith("noise cancelling")
-        assert len(response.results) == 1
-        result = response.results[0]
-        assert result.url == "https://www.example.com/headphones"
-        assert result.store_id is not None
-        assert result.store_name == "Example Store"
-        assert response.extra["engines"] == {"google": 1}
-        assert len(calls) == 1
-
-        cached_entries = session.exec(select(SearchCache)).all()
-        assert len(cached_entries) == 1
-        cache_entry = cached_entries[0]
-        assert cache_entry.query == response.query
-        payload = cast(dict[str, Any], cache_entry.response)
-        raw_results = payload.get("results", [])
-        assert isinstance(raw_results, list)
-        first_raw = cast(dict[str, Any], raw_results[0])
-        assert first_raw.get("url") == result.url
-
-
-def test_service_uses_cache_without_http_call(engine: Any) -> None:
+    user = _persist_user_with_store(session)
+    response = service.search(session, query="noise cancelling", owner=user)
+
+    assert response.cache_hit is False
+    assert response.query.startswith("noise cancelling")
+    assert len(response.results) == 1
+    result = response.results[0]
+    assert result.url == "https://www.example.com/headphones"
+    assert result.store_id is not None
+    assert result.store_name == "Example Store"
+    assert response.extra["engines"] == {"google": 1}
+    assert len(calls) == 1
+    assert calls[0].url == "https://searx.local/search"
+    assert calls[0].params["q"] == response.query
+
+    cached_entries = session.exec(select(SearchCache)).all()
+    assert len(cached_entries) == 1
+    cache_entry = cached_entries[0]
+    assert cache_entry.query == response.query
+    payload = cast(dict[str, Any], cache_entry.response)
+    raw_results = payload.get("results", [])
+    assert isinstance(raw_results, list)
+    first_raw = cast(dict[str, Any], raw_results[0])
+    assert first_raw.get("url") == result.url
+
+
+def test_service_uses_cache_without_http_call(session: Session) -> None:
     responses = [
         {
             "results": [
@@ -224,7 +242,7 @@ def test_service_uses_cache_without_http_call(engine: Any) -> None:
             ]
         }
     ]
-    first_calls: list[dict[str, Any]] = []
+    first_calls: list[Call] = []
 
     def first_factory(timeout: httpx.Timeout) -> HttpClient:
         return FakeHttpClient(responses, first_calls)
@@ -232,32 +250,31 @@ def test_service_uses_cache_without_http_call(engine: Any) -> None:
     service_settings = Settings(searxng_url="https://searx.local/search")
     service = _build_service(settings=service_settings, http_factory=first_factory)
 
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        _ = service.search(session, query="mechanical keyboard", owner=user)
-        assert len(first_calls) == 1
+    user = _persist_user_with_store(session)
+    _ = service.search(session, query="mechanical keyboard", owner=user)
+    assert len(first_calls) == 1
 
-        called = False
+    called = False
 
-        def failing_factory(timeout: httpx.Timeout) -> HttpClient:
-            nonlocal called
-            called = True
-            raise AssertionError("HTTP client should not be invoked when cache is warm")
+    def failing_factory(timeout: httpx.Timeout) -> HttpClient:
+        nonlocal called
+        called = True
+        raise AssertionError("HTTP client should not be invoked when cache is warm")
 
-        cached_service = _build_service(
-            settings=service_settings, http_factory=failing_factory
-        )
-        cached_response = cached_service.search(
-            session,
-            query="mechanical keyboard",
-            owner=user,
-        )
-        assert cached_response.cache_hit is True
-        assert called is False
-        assert len(cached_response.results) == 1
+    cached_service = _build_service(
+        settings=service_settings, http_factory=failing_factory
+    )
+    cached_response = cached_service.search(
+        session,
+        query="mechanical keyboard",
+        owner=user,
+    )
+    assert cached_response.cache_hit is True
+    assert called is False
+    assert len(cached_response.results) == 1
 
 
-def test_service_raises_on_http_error(engine: Any) -> None:
+def test_service_raises_on_http_error(session: Session) -> None:
     service_settings = Settings(searxng_url="https://searx.local/search")
 
     def factory(timeout: httpx.Timeout) -> HttpClient:
@@ -265,14 +282,13 @@ def test_service_raises_on_http_error(engine: Any) -> None:
 
     service = _build_service(settings=service_settings, http_factory=factory)
 
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        response = service.search(session, query="test", owner=user, force_refresh=True)
-        assert response.cache_hit is False
-        assert response.extra.get("fallback") == "local-cache"
+    user = _persist_user_with_store(session)
+    response = service.search(session, query="test", owner=user, force_refresh=True)
+    assert response.cache_hit is False
+    assert response.extra.get("fallback") == "local-cache"
 
 
-def test_service_returns_local_results_when_disabled(engine: Any) -> None:
+def test_service_returns_local_results_when_disabled(session: Session) -> None:
     service_settings = Settings(searxng_url=None)
 
     def factory(timeout: httpx.Timeout) -> HttpClient:
@@ -280,26 +296,25 @@ def test_service_returns_local_results_when_disabled(engine: Any) -> None:
 
     service = _build_service(settings=service_settings, http_factory=factory)
 
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        store = session.exec(
-            select(models.Store).where(models.Store.user_id == user.id)
-        ).one()
-        _create_product_with_url(
-            session,
-            user=user,
-            store=store,
-            name="Satechi Qi2 Trio Wireless Charging Pad",
-            url="https://example.com/satechi-qi2",
-        )
+    user = _persist_user_with_store(session)
+    store = session.exec(
+        select(models.Store).where(models.Store.user_id == user.id)
+    ).one()
+    _create_product_with_url(
+        session,
+        user=user,
+        store=store,
+        name="Satechi Qi2 Trio Wireless Charging Pad",
+        url="https://example.com/satechi-qi2",
+    )
 
-        response = service.search(session, query="satechi", owner=user)
-        assert response.cache_hit is False
-        assert response.extra.get("fallback") == "disabled"
-        assert response.results
-        first = response.results[0]
-        assert first.url == "https://example.com/satechi-qi2"
-        assert first.store_id == store.id
+    response = service.search(session, query="satechi", owner=user)
+    assert response.cache_hit is False
+    assert response.extra.get("fallback") == "disabled"
+    assert response.results
+    first = response.results[0]
+    assert first.url == "https://example.com/satechi-qi2"
+    assert first.store_id == store.id
 
 
 def test_default_http_client_factory_closes() -> None:
@@ -312,114 +327,175 @@ def test_default_http_client_factory_closes() -> None:
         cast(httpx.Client, client).close()
 
 
-def test_resolve_settings_coerces_string_values(engine: Any) -> None:
+def test_resolve_settings_coerces_string_values(session: Session) -> None:
     settings_obj = Settings(
         searxng_url="https://searx",
         search_cache_ttl_seconds=200000,
     )
     service = _build_service(
         settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
+        http_factory=_unused_http_client,
     )
-    with Session(engine) as session:
-        session.add(
-            models.AppSetting(
-                key="integrated_services",
-                value='{"searxng": {"url": "https://override", "max_pages": "3", "prune_days": "1"}}',
-            )
+    session.add(
+        models.AppSetting(
+            key="integrated_services",
+            value='{"searxng": {"url": "https://override", "max_pages": "3", "prune_days": "1"}}',
         )
-        session.commit()
-        integration = service._resolve_settings(session)
-        assert integration.url == "https://override"
-        assert integration.max_pages == 3
-        assert integration.prune_days == 1
-        assert integration.cache_ttl_seconds == 86400
-
-
-def test_resolve_settings_clamps_invalid_pages(engine: Any) -> None:
-    settings_obj = Settings(searxng_url="https://searx")
-    service = _build_service(
-        settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
     )
-    with Session(engine) as session:
-        session.add(
-            models.AppSetting(
-                key="integrated_services",
-                value='{"searxng": {"url": "https://override", "max_pages": -5}}',
-            )
+    session.commit()
+    integration = service._resolve_settings(session)
+    assert integration.url == "https://override"
+    assert integration.max_pages == 3
+    assert integration.prune_days == 1
+    assert integration.cache_ttl_seconds == 86400
+
+
+def test_resolve_settings_clamps_invalid_pages(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    session.add(
+        models.AppSetting(
+            key="integrated_services",
+            value='{"searxng": {"url": "https://override", "max_pages": -5}}',
         )
-        session.commit()
-        integration = service._resolve_settings(session)
-        assert integration.max_pages == 1
-        assert service._resolve_page_count(integration, override=5) == 1
+    )
+    session.commit()
+    integration = default_service._resolve_settings(session)
+    assert integration.max_pages == 1
+    assert default_service._resolve_page_count(integration, override=5) == 1
 
 
-def test_load_integration_settings_handles_invalid_payload(engine: Any) -> None:
-    service = _build_service(
-        settings=Settings(searxng_url="https://searx"),
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
-    )
-    with Session(engine) as session:
-        session.add(
-            models.AppSetting(
-                key="integrated_services",
-                value="not-json",
-            )
+def test_resolve_settings_uses_orjson(
+    session: Session,
+    default_service: SearxSearchService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parsed: list[str | bytes] = []
+    original_loads = orjson.loads
+
+    def _counting_loads(value: str | bytes) -> Any:
+        parsed.append(value)
+        return original_loads(value)
+
+    monkeypatch.setattr(orjson, "loads", _counting_loads)
+    session.add(
+        models.AppSetting(
+            key="integrated_services",
+            value='{"searxng": {"url": "https://override", "max_pages": 2}}',
         )
-        session.commit()
-        assert service._load_integration_settings(session) == {}
+    )
+    session.commit()
 
+    integration = default_service._resolve_settings(session)
 
-def test_load_cache_skips_invalid_payload(engine: Any) -> None:
-    service = _build_service(
-        settings=Settings(searxng_url="https://searx"),
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
+    assert len(parsed) == 1
+    assert integration.url == "https://override"
+    assert integration.max_pages == 2
+
+
+def test_load_integration_settings_handles_invalid_payload(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    session.add(
+        models.AppSetting(
+            key="integrated_services",
+            value="not-json",
+        )
     )
-    with Session(engine) as session:
-        future = utcnow() + timedelta(seconds=60)
-        session.add(
-            SearchCache(
-                query_hash="hash",
-                query="widgets",
-                response={"results": "invalid"},
-                expires_at=future,
-            )
+    session.commit()
+    assert default_service._load_integration_settings(session) == {}
+
+
+def test_load_cache_skips_invalid_payload(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    future = utcnow() + timedelta(seconds=60)
+    session.add(
+        SearchCache(
+            query_hash="hash",
+            query="widgets",
+            response={"results": "invalid"},
+            expires_at=future,
         )
-        session.commit()
-        assert service._load_cache(session, "hash") is None
+    )
+    session.commit()
+    assert default_service._load_cache(session, "hash") is None
+
+
+def test_load_cache_filters_non_dict_items(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    reference = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
+    future = reference + timedelta(seconds=60)
+    session.add(
+        SearchCache(
+            query_hash="hash",
+            query="widgets",
+            response={
+                "results": [
+                    "ignore",
+                    {"url": "https://example.com", "title": "Item"},
+                ]
+            },
+            expires_at=future,
+        )
+    )
+    session.commit()
+    cached = default_service._load_cache(session, "hash", now=reference)
+    assert cached is not None
+    results, expiry = cached
+    assert len(results) == 1
+    assert results[0].url == "https://example.com"
+    assert expiry == future
+
+
+def test_load_cache_many_reads_hashes_in_one_query(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    reference = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
+    hashes = [f"hash-{index}" for index in range(10)]
+    session.add_all(
+        SearchCache(
+            query_hash=query_hash,
+            query=query_hash,
+            response={"results": [{"url": f"https://example.com/{query_hash}"}]},
+            expires_at=reference + timedelta(minutes=5),
+        )
+        for query_hash in hashes
+    )
+    session.add(
+        SearchCache(
+            query_hash="expired",
+            query="expired",
+            response={"results": []},
+            expires_at=reference - timedelta(minutes=5),
+        )
+    )
+    session.commit()
+    cache_queries: list[str] = []
 
+    def _record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if "FROM search_cache" in statement:
+            cache_queries.append(statement)
 
-def test_load_cache_filters_non_dict_items(engine: Any) -> None:
-    service = _build_service(
-        settings=Settings(searxng_url="https://searx"),
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
-    )
-    with Session(engine) as session:
-        future = utcnow() + timedelta(seconds=60)
-        session.add(
-            SearchCache(
-                query_hash="hash",
-                query="widgets",
-                response={
-                    "results": [
-                        "ignore",
-                        {"url": "https://example.com", "title": "Item"},
-                    ]
-                },
-                expires_at=future,
-            )
+    engine = session.connection().engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        loaded = default_service._load_cache_many(
+            session, [*hashes, "expired", "missing"], now=reference
         )
-        session.commit()
-        cached = service._load_cache(session, "hash")
-        assert cached is not None
-        results, expiry = cached
-        assert len(results) == 1
-        assert results[0].url == "https://example.com"
-        assert expiry > utcnow()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(cache_queries) == 1
+    assert sorted(loaded) == sorted(hashes)
+    results, expiry = loaded["hash-3"]
+    assert [result.url for result in results] == ["https://example.com/hash-3"]
+    assert expiry == reference + timedelta(minutes=5)
+    assert default_service._load_cache_many(session, []) == {}
 
 
-def test_fetch_results_deduplicates_urls(engine: Any) -> None:
+def test_fetch_results_deduplicates_urls(session: Session) -> None:
     responses = [
         {
             "results": [
@@ -435,127 +511,203 @@ def test_fetch_results_deduplicates_urls(engine: Any) -> None:
     service = _build_service(
         settings=Settings(searxng_url="https://searx"), http_factory=factory
     )
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        result = service.search(
-            session, query="duplicate", owner=user, force_refresh=True
-        )
-        assert len(result.results) == 1
+    user = _persist_user_with_store(session)
+    result = service.search(session, query="duplicate", owner=user, force_refresh=True)
+    assert len(result.results) == 1
 
 
-def test_normalize_result_rejects_invalid_entries() -> None:
+def test_fetch_results_dedup_linear(monkeypatch: pytest.MonkeyPatch) -> None:
+    duplicate = {"url": " https://example.com/a ", "title": "Repeat"}
+    responses = [{"results": [duplicate] * 5000}]
     service = _build_service(
         settings=Settings(searxng_url="https://searx"),
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
+        http_factory=lambda timeout: FakeHttpClient(responses, calls=[]),
     )
-    assert service._normalize_result("not-a-dict") is None
-    assert service._normalize_result({"url": ""}) is None
-    assert service._normalize_result({"url": "https://example.com/file.pdf"}) is None
+    normalized: list[Any] = []
+    original = service._normalize_result
 
+    def _counting_normalize(raw: Any) -> Any:
+        normalized.append(raw)
+        return original(raw)
 
-def test_build_store_lookup_handles_mixed_domains(engine: Any) -> None:
-    service = _build_service(
-        settings=Settings(searxng_url="https://searx"),
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
+    monkeypatch.setattr(service, "_normalize_result", _counting_normalize)
+
+    results = service._fetch_results("https://searx", "duplicate", 1)
+
+    assert [result.url for result in results] == ["https://example.com/a"]
+    assert len(normalized) == 1
+
+
+def test_hash_query_is_stable_and_case_insensitive(
+    default_service: SearxSearchService,
+) -> None:
+    digest = default_service._hash_query("https://SEARX.local", "Noise Cancelling", 2)
+
+    # Cache rows are shared across workers and restarts, so the key must not
+    # depend on per-process hash seeds and must fit SearchCache.query_hash.
+    assert digest == "7f6d8f227f47e0917e2b9c92544b7f3fd555d26311cda1bbf2c46311825dc04f"
+    assert digest == default_service._hash_query(
+        "https://searx.local", "noise cancelling", 2
+    )
+    assert len(digest) <= 64
+
+
+def test_normalize_result_rejects_invalid_entries(
+    default_service: SearxSearchService,
+) -> None:
+    assert default_service._normalize_result("not-a-dict") is None
+    assert default_service._normalize_result({"url": ""}) is None
+    assert (
+        default_service._normalize_result({"url": "https://example.com/file.pdf"})
+        is None
     )
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
+
+
+def test_build_store_lookup_handles_mixed_domains(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    user = _persist_user_with_store(session)
+    store = session.exec(
+        select(models.Store).where(models.Store.user_id == user.id)
+    ).one()
+    domains: list[Any] = [
+        {"domain": "example.org"},
+        "www.example.org",
+        {"domain": 123},
+    ]
+    store.domains = cast(list[dict[str, Any]], domains)
+    session.add(store)
+    session.commit()
+
+    assert user.id is not None
+    lookup = default_service._build_store_lookup(session, owner_id=user.id)
+    assert lookup["example.org"][0] == store.id
+    assert lookup["www.example.org"][0] == store.id
+
+
+def test_build_store_lookup_cached(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    user = _persist_user_with_store(session)
+    assert user.id is not None
+    store_loads: list[str] = []
+
+    def _record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if "stores.domains" in statement:
+            store_loads.append(statement)
+
+    engine = session.connection().engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        first = default_service._build_store_lookup(session, owner_id=user.id)
+        second = default_service._build_store_lookup(session, owner_id=user.id)
+        assert len(store_loads) == 1
+        assert second == first
+
         store = session.exec(
             select(models.Store).where(models.Store.user_id == user.id)
         ).one()
-        domains: list[Any] = [
-            {"domain": "example.org"},
-            "www.example.org",
-            {"domain": 123},
-        ]
-        store.domains = cast(list[dict[str, Any]], domains)
+        store.domains = [{"domain": "example.net"}]
         session.add(store)
         session.commit()
+        store_loads.clear()
 
-        assert user.id is not None
-        lookup = service._build_store_lookup(session, owner_id=user.id)
-        assert lookup["example.org"][0] == store.id
-        assert lookup["www.example.org"][0] == store.id
+        refreshed = default_service._build_store_lookup(session, owner_id=user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
 
+    assert len(store_loads) == 1
+    assert "example.com" in first
+    assert "example.net" in refreshed
+    assert "example.com" not in refreshed
 
-def test_search_rejects_blank_query(engine: Any) -> None:
-    settings_obj = Settings(searxng_url="https://searx")
-    service = _build_service(
-        settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
-    )
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        with pytest.raises(HTTPException) as exc:
-            service.search(session, query="   ", owner=user)
-        assert exc.value.status_code == 400
 
+def test_store_updated_at_only_moves_on_column_edits(session: Session) -> None:
+    user = _persist_user_with_store(session)
+    store = session.exec(
+        select(models.Store).where(models.Store.user_id == user.id)
+    ).one()
+    original = store.updated_at
 
-def test_search_requires_persisted_user(engine: Any) -> None:
-    settings_obj = Settings(searxng_url="https://searx")
-    service = _build_service(
-        settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
-    )
-    with Session(engine) as session:
-        transient_user = models.User(email="ephemeral@example.com")
-        with pytest.raises(HTTPException) as exc:
-            service.search(session, query="widgets", owner=transient_user)
-        assert exc.value.status_code == 500
+    store.product_urls = []
+    session.add(store)
+    session.commit()
+    session.refresh(store)
+    assert store.updated_at == original
+
+    store.notes = "Renamed"
+    session.add(store)
+    session.commit()
+    session.refresh(store)
+    assert store.updated_at > original
+
+
+def test_search_rejects_blank_query(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    user = _persist_user_with_store(session)
+    with pytest.raises(HTTPException) as exc:
+        default_service.search(session, query="   ", owner=user)
+    assert exc.value.status_code == 400
 
 
-def test_search_requires_configuration(engine: Any) -> None:
+def test_search_requires_persisted_user(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    transient_user = models.User(email="ephemeral@example.com")
+    with pytest.raises(HTTPException) as exc:
+        default_service.search(session, query="widgets", owner=transient_user)
+    assert exc.value.status_code == 500
+
+
+def test_search_requires_configuration(session: Session) -> None:
     settings_obj = Settings(searxng_url=None)
     service = _build_service(
         settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
+        http_factory=_unused_http_client,
     )
-    with Session(engine) as session:
-        user = _persist_user_with_store(session)
-        response = service.search(session, query="widgets", owner=user)
-        assert response.cache_hit is False
-        assert response.extra.get("fallback") == "disabled"
-        assert response.results == []
+    user = _persist_user_with_store(session)
+    response = service.search(session, query="widgets", owner=user)
+    assert response.cache_hit is False
+    assert response.extra.get("fallback") == "disabled"
+    assert response.results == []
 
 
-def test_search_prune_days_limits_ttl(engine: Any) -> None:
+def test_search_prune_days_limits_ttl(session: Session) -> None:
     settings_obj = Settings(
         searxng_url="https://searx",
         search_cache_ttl_seconds=172800,
     )
     service = _build_service(
         settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
+        http_factory=_unused_http_client,
     )
-    with Session(engine) as session:
-        session.add(
-            models.AppSetting(
-                key="integrated_services",
-                value='{"searxng": {"url": "https://searx", "enabled": true, "prune_days": 1}}',
-            )
+    session.add(
+        models.AppSetting(
+            key="integrated_services",
+            value='{"searxng": {"url": "https://searx", "enabled": true, "prune_days": 1}}',
         )
-        session.commit()
+    )
+    session.commit()
 
-        integration = service._resolve_settings(session)
-        assert integration.cache_ttl_seconds == 86400
+    integration = service._resolve_settings(session)
+    assert integration.cache_ttl_seconds == 86400
 
 
-def test_search_load_cache_ignores_expired_entries(engine: Any) -> None:
-    settings_obj = Settings(searxng_url="https://searx")
-    service = _build_service(
-        settings=settings_obj,
-        http_factory=lambda t: ErrorHttpClient(RuntimeError("unused")),
-    )
-    with Session(engine) as session:
-        expired = utcnow() - timedelta(seconds=5)
-        session.add(
-            SearchCache(
-                query_hash="hash",
-                query="widgets",
-                response={"results": []},
-                expires_at=expired,
-            )
+def test_search_load_cache_ignores_expired_entries(
+    session: Session, default_service: SearxSearchService
+) -> None:
+    reference = datetime(2025, 9, 27, 9, 0, tzinfo=UTC)
+    session.add(
+        SearchCache(
+            query_hash="hash",
+            query="widgets",
+            response={"results": []},
+            expires_at=reference + timedelta(seconds=5),
         )
-        session.commit()
+    )
+    session.commit()
 
-        assert service._load_cache(session, "hash") is None
+    assert default_service._load_cache(session, "hash", now=reference) is not None
+    later = reference + timedelta(seconds=5)
+    assert default_service._load_cache(session, "hash", now=later) is None
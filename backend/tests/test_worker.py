@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Iterator
+from datetime import timedelta
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
+import orjson
 import pytest
+from celery.schedules import crontab
 
 from app.core.config import settings
-from app.worker import _apply_schedule_from_json, _load_beat_schedule, celery_app
+from app.worker import _apply_schedule, _load_beat_schedule, celery_app
 
 
 def test_celery_app_configuration_matches_settings() -> None:
@@ -35,67 +36,69 @@ def schedule_guard() -> Iterator[None]:
         celery_app.conf.beat_schedule = original
 
 
-def test_apply_schedule_from_json_updates_celery(schedule_guard: None) -> None:
-    with TemporaryDirectory() as tmpdir:
-        path = Path(tmpdir) / "schedule.json"
-        path.write_text(
-            json.dumps(
-                {
-                    "pricing.update_all_products": {
-                        "task": "pricing.update_all_products",
-                        "schedule": 3600,
-                        "args": [],
-                    }
-                }
-            ),
-            encoding="utf-8",
-        )
+def test_apply_schedule_updates_celery(schedule_guard: None) -> None:
+    count = _apply_schedule(
+        {
+            "pricing.update_all_products": {
+                "task": "pricing.update_all_products",
+                "schedule": 3600,
+                "args": [],
+            },
+            "pricing.nightly": {"schedule": "cron", "minute": 30, "hour": 2},
+            "pricing.disabled": {"enabled": False, "schedule": 60},
+        }
+    )
 
-        count = _apply_schedule_from_json(path)
-        assert count == 1
-        entry = celery_app.conf.beat_schedule["pricing.update_all_products"]
-        from datetime import timedelta
-
-        assert entry["schedule"].run_every == timedelta(seconds=3600)
-
-
-def test_load_beat_schedule_reads_config(schedule_guard: None) -> None:
-    with TemporaryDirectory() as tmpdir:
-        path = Path(tmpdir) / "schedule.json"
-        path.write_text(
-            json.dumps(
-                {
-                    "custom.task": {
-                        "task": "custom.task",
-                        "schedule": 1800,
-                        "args": [1, 2, 3],
-                        "kwargs": {"logging": True},
-                    }
+    assert count == 2
+    beat_schedule = celery_app.conf.beat_schedule
+    assert set(beat_schedule) == {"pricing.update_all_products", "pricing.nightly"}
+    entry = beat_schedule["pricing.update_all_products"]
+    assert entry["schedule"].run_every == timedelta(seconds=3600)
+    nightly = beat_schedule["pricing.nightly"]
+    assert nightly["task"] == "pricing.nightly"
+    assert nightly["schedule"] == crontab(minute=30, hour=2)
+    assert nightly["kwargs"] == {}
+
+
+def test_load_beat_schedule_reads_config(schedule_guard: None, tmp_path: Path) -> None:
+    path = tmp_path / "schedule.json"
+    path.write_bytes(
+        orjson.dumps(
+            {
+                "custom.task": {
+                    "task": "custom.task",
+                    "schedule": 1800,
+                    "args": [1, 2, 3],
+                    "kwargs": {"logging": True},
                 }
-            ),
-            encoding="utf-8",
+            }
         )
+    )
 
-        previous_path = settings.celery_beat_schedule_path
-        settings.celery_beat_schedule_path = str(path)
-        try:
-            _load_beat_schedule()
-            assert "custom.task" in celery_app.conf.beat_schedule
-            entry = celery_app.conf.beat_schedule["custom.task"]
-            assert entry["kwargs"]["logging"] is True
-        finally:
-            settings.celery_beat_schedule_path = previous_path
-
-
-def test_load_beat_schedule_handles_invalid_json(schedule_guard: None) -> None:
-    with TemporaryDirectory() as tmpdir:
-        path = Path(tmpdir) / "schedule.json"
-        path.write_text("not-json", encoding="utf-8")
-
-        previous_path = settings.celery_beat_schedule_path
-        settings.celery_beat_schedule_path = str(path)
-        try:
-            _load_beat_schedule()
-            assert "pricing.update_all_products" in celery_app.conf.beat_schedule
-        finally:
-            settings.celery_beat_schedule_path = previous_path
+    previous_path = settings.celery_beat_schedule_path
+    settings.celery_beat_schedule_path = str(path)
+    try:
+        _load_beat_schedule()
+        assert "custom.task" in celery_app.conf.beat_schedule
+        entry = celery_app.conf.beat_schedule["custom.task"]
+        assert entry["kwargs"]["logging"] is True
+    finally:
+        settings.celery_beat_schedule_path = previous_path
+
+
+@pytest.mark.parametrize(
+    "content", [b"not-json", b'{"task": "\xff"}'], ids=["malformed", "invalid-utf8"]
+)
+def test_load_beat_schedule_handles_invalid_json(
+    schedule_guard: None, tmp_path: Path, content: bytes
+) -> None:
+    path = tmp_path / "schedule.json"
+    path.write_bytes(content)
+
+    previous_path = settings.celery_beat_schedule_path
+    settings.celery_beat_schedule_path = str(path)
+    try:
+        _load_beat_schedule()
+        assert "pricing.update_all_products" in celery_app.conf.beat_schedule
+    finally:
+        settings.celery_beat_schedule_path = previous_path
@@ -2,30 +2,37 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, ClassVar, Final
 from urllib.parse import urlparse
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import Response as HTTPResponse
 from pydantic import BaseModel, HttpUrl
 from playwright.async_api import (
     Browser,
     BrowserContext,
+    Error as PlaywrightError,
     Page,
     Playwright,
     Response,
+    StorageState,
     async_playwright,
 )
 
 LOGGER = logging.getLogger("costcourter.scraper")
 
-DEFAULT_USER_AGENT = (
+DEFAULT_USER_AGENT: Final[str] = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
 )
 
-DEFAULT_HEADERS = {
+DEFAULT_HEADERS: Final[dict[str, str]] = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
     "Cache-Control": "no-cache",
@@ -40,11 +47,122 @@ DEFAULT_HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+_OVERRIDE_SCRIPT: Final[str] = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    window.chrome = window.chrome || { runtime: {} };
+    Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
+    Object.defineProperty(navigator, 'language', { get: () => 'en-US' });
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+    Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
+    Object.defineProperty(navigator, 'deviceMemory', { get: () => 8 });
+    Object.defineProperty(navigator, 'maxTouchPoints', { get: () => 0 });
+    if (!navigator.userAgentData) {
+        const uaData = {
+            brands: [
+                { brand: 'Chromium', version: '128' },
+                { brand: 'Google Chrome', version: '128' },
+                { brand: 'Not=A?Brand', version: '24' },
+            ],
+            mobile: false,
+            platform: 'Windows',
+            getHighEntropyValues: async () => ({
+                architecture: 'x86',
+                bitness: '64',
+                model: '',
+                platform: 'Windows',
+                platformVersion: '15.0.0',
+                uaFullVersion: '128.0.0.0',
+                fullVersionList: [
+                    { brand: 'Chromium', version: '128.0.0.0' },
+                    { brand: 'Google Chrome', version: '128.0.0.0' },
+                    { brand: 'Not=A?Brand', version: '24.0.0.0' },
+                ],
+            }),
+            toJSON: () => uaData,
+        };
+        Object.defineProperty(navigator, 'userAgentData', {
+            get: () => uaData,
+        });
+    }
+"""
+
+# Page scripts are kept as module constants rather than installed as window
+# globals: extra globals are exactly what bot-detection probes look for.
+_EXTRACT_PAGE_SCRIPT: Final[str] = """
+(includeHtml) => {
+    const tags = Array.from(document.querySelectorAll('meta'));
+    const meta = tags.flatMap(tag => {
+        const key = tag.getAttribute('property') || tag.getAttribute('name');
+        if (!key) return [];
+        const value = tag.getAttribute('content');
+        if (!value) return [];
+        return [key.trim(), value.trim()];
+    });
+    const root = document.documentElement;
+    let html = null;
+    if (includeHtml) {
+        const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+        html = doctype + (root ? root.outerHTML : '');
+    }
+    return { title: document.title || '', lang: (root && root.lang) || '', meta, html };
+}
+"""
+
+_CHEWY_PROBE_SCRIPT: Final[str] = """
+() => {
+    const blockingScript = document.querySelector('script[src*="ips.js"], script[src*="akamai"]');
+    const captcha = document.querySelector('[data-captcha], #px-captcha, #cf-chl-widget');
+    const tooMany = document.body && document.body.innerText && document.body.innerText.includes('Too Many Requests');
+    const title = document.querySelector("h1[data-testid='product-title']");
+    const ogMeta = document.querySelector('meta[property="og:title"], meta[name="og:title"]');
+    return [!!blockingScript, !!captcha, !!tooMany, !!(title || ogMeta)];
+}
+"""
+
+_CHEWY_READY_SCRIPT: Final[str] = """
+() => {
+    const title = document.querySelector("h1[data-testid='product-title']");
+    const og = document.querySelector("meta[property='og:title'], meta[name='og:title']");
+    if (!(title || og)) return false;
+    const blockingScript = document.querySelector('script[src*="ips.js"], script[src*="akamai"]');
+    const captcha = document.querySelector('[data-captcha], #px-captcha, #cf-chl-widget');
+    const tooMany = document.body && document.body.innerText && document.body.innerText.includes('Too Many Requests');
+    return !(blockingScript || captcha || tooMany);
+}
+"""
+
+_CHEWY_READY_TIMEOUT_MS = 30000
+_CHEWY_READY_POLLING_MS = 500
+_CHEWY_NAVIGATION_ATTEMPTS = 3
+_CHEWY_STORAGE_PERSIST_INTERVAL_S = 60.0
+_CHEWY_HOST = "chewy.com"
+
+
+@lru_cache(maxsize=1024)
+def _classify_host(hostname: str) -> str:
+    """Map a hostname onto the ``ScraperService`` fetcher that handles it."""
+
+    return "chewy" if hostname.endswith("chewy.com") else "generic"
+
 
 @dataclass(slots=True)
 class BrowserPool:
+    """Chromium instance plus a queue of warmed, reusable browser contexts.
+
+    Contexts are created with the default headers and the navigator override
+    script already installed, so a request only pays for opening a page.
+    Callers that need an isolated cookie jar pass ``pooled=False``; storage
+    state worth carrying between those contexts is kept per host here, so the
+    scraper service itself stays immutable.
+    """
+
     playwright: Playwright | None = None
     browser: Browser | None = None
+    initial_size: int = 2
+    contexts: asyncio.Queue[BrowserContext] = field(default_factory=asyncio.Queue)
+    host_state: dict[str, StorageState] = field(default_factory=dict)
+    _state_saved_at: dict[str, float] = field(default_factory=dict, repr=False)
+    _state_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
     async def startup(self) -> None:
         if self.playwright is not None:
@@ -62,17 +180,32 @@ class BrowserPool:
                 "--window-size=1280,720",
             ],
         )
+        for _ in range(self.initial_size):
+            self.contexts.put_nowait(await self._new_context())
 
     async def shutdown(self) -> None:
+        pooled: list[BrowserContext] = []
+        while not self.contexts.empty():
+            pooled.append(self.contexts.get_nowait())
+        results = await asyncio.gather(
+            *(context.close() for context in pooled), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                LOGGER.debug("Failed to close pooled browser context", exc_info=result)
         if self.browser is not None:
-            await self.browser.close()
+            try:
+                await self.browser.close()
+            except Exception:
+                LOGGER.debug("Failed to close browser", exc_info=True)
             self.browser = None
         if self.playwright is not None:
             await self.playwright.stop()
             self.playwright = None
 
-    @asynccontextmanager
-    async def context(self, *, storage_state: dict[str, Any] | None = None) -> BrowserContext:
+    async def _new_context(
+        self, *, storage_state: StorageState | None = None
+    ) -> BrowserContext:
         if self.browser is None:
             raise RuntimeError("Browser not initialised")
         context = await self.browser.new_context(
@@ -84,38 +217,108 @@ class BrowserPool:
             extra_http_headers=DEFAULT_HEADERS,
             storage_state=storage_state,
         )
+        await context.add_init_script(_OVERRIDE_SCRIPT)
+        return context
+
+    @asynccontextmanager
+    async def context(
+        self,
+        *,
+        storage_state: StorageState | None = None,
+        pooled: bool = True,
+    ) -> AsyncIterator[BrowserContext]:
+        if storage_state is not None or not pooled:
+            seeded = await self._new_context(storage_state=storage_state)
+            try:
+                yield seeded
+            finally:
+                await seeded.close()
+            return
+
+        try:
+            context = self.contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            context = await self._new_context()
         try:
             yield context
         finally:
+            await self._release(context)
+
+    async def _release(self, context: BrowserContext) -> None:
+        # Cookies and granted permissions are dropped so one site's session
+        # never rides along into the next scrape. Per-origin localStorage and
+        # the HTTP cache survive: they cannot be wiped without loading every
+        # origin, and the pool only serves anonymous, stateless page loads.
+        try:
+            for page in context.pages:
+                await page.close()
+            await context.clear_cookies()
+            await context.clear_permissions()
+        except Exception:
+            LOGGER.debug("Discarding browser context that failed to reset", exc_info=True)
+            await context.close()
+            return
+        if self.browser is not None and self.contexts.qsize() < self.initial_size:
+            self.contexts.put_nowait(context)
+        else:
             await context.close()
 
+    def get_state(self, host: str) -> StorageState | None:
+        return self.host_state.get(host)
 
-@dataclass(slots=True)
+    async def save_state(
+        self, host: str, context: BrowserContext, *, min_interval: float
+    ) -> None:
+        """Snapshot ``context`` storage for ``host`` at most once per interval.
+
+        Concurrent callers skip the snapshot instead of queueing on the lock.
+        """
+
+        now = time.monotonic()
+        if (
+            self._state_lock.locked()
+            or now - self._state_saved_at.get(host, float("-inf")) < min_interval
+        ):
+            return
+        async with self._state_lock:
+            self._state_saved_at[host] = now
+            try:
+                self.host_state[host] = await context.storage_state()
+            except Exception:  # noqa: BLE001
+                LOGGER.debug("Unable to persist %s storage state", host, exc_info=True)
+
+
+@dataclass(slots=True, frozen=True)
 class ScraperService:
     pool: BrowserPool
     navigation_timeout_ms: int = 45000
     wait_after_load_ms: int = 1500
-    chewy_storage_state: dict[str, Any] | None = None
+    chewy_concurrency: int = 2
+    _chewy_slots: asyncio.Semaphore = field(init=False, repr=False)
 
-    async def fetch(self, url: str) -> dict[str, Any]:
-        hostname = urlparse(url).hostname or ""
-        if hostname.endswith("chewy.com"):
-            return await self._fetch_chewy(url)
-        return await self._fetch_generic(url)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_chewy_slots", asyncio.Semaphore(self.chewy_concurrency))
 
-    async def _fetch_generic(self, url: str) -> dict[str, Any]:
+    async def fetch(self, url: str, *, need_html: bool = True) -> dict[str, Any]:
+        fetcher = self._FETCHERS[_classify_host(urlparse(url).hostname or "")]
+        return await fetcher(self, url, need_html)
+
+    async def _fetch_generic(self, url: str, need_html: bool) -> dict[str, Any]:
         async with self.pool.context() as context:
             page = await context.new_page()
-            await page.set_extra_http_headers(DEFAULT_HEADERS)
-            await self._prime_page(page)
             await self._navigate(page, url)
-            return await self._extract_payload(page, url)
+            return await self._extract_payload(page, url, need_html=need_html)
+
+    async def _fetch_chewy(self, url: str, need_html: bool) -> dict[str, Any]:
+        # Parallel Chewy sessions trip Akamai far more often, so cap them.
+        async with self._chewy_slots:
+            return await self._scrape_chewy(url, need_html)
 
-    async def _fetch_chewy(self, url: str) -> dict[str, Any]:
-        async with self.pool.context(storage_state=self.chewy_storage_state) as context:
+    async def _scrape_chewy(self, url: str, need_html: bool) -> dict[str, Any]:
+        async with self.pool.context(
+            storage_state=self.pool.get_state(_CHEWY_HOST), pooled=False
+        ) as context:
             page = await context.new_page()
-            await page.set_extra_http_headers(DEFAULT_HEADERS)
-            await self._prime_page(page)
             try:
                 await self._navigate(
                     page,
@@ -135,57 +338,46 @@ class ScraperService:
             )
             # If Akamai still serves a throttle page, try once more after delay
             await self._ensure_chewy_content(page, url)
-            result = await self._extract_payload(page, url)
-            try:
-                self.chewy_storage_state = await context.storage_state()
-            except Exception:  # noqa: BLE001
-                LOGGER.debug("Unable to persist chewy storage state", exc_info=True)
+            result = await self._extract_payload(page, url, need_html=need_html)
+            await self.pool.save_state(
+                _CHEWY_HOST, context, min_interval=_CHEWY_STORAGE_PERSIST_INTERVAL_S
+            )
             return result
 
     async def _ensure_chewy_content(self, page: Page, url: str) -> None:
-        probe_script = """
-        () => {
-            const blockingScript = document.querySelector('script[src*="ips.js"], script[src*="akamai"]');
-            const captcha = document.querySelector('[data-captcha], #px-captcha, #cf-chl-widget');
-            const tooMany = document.body && document.body.innerText && document.body.innerText.includes('Too Many Requests');
-            const title = document.querySelector("h1[data-testid='product-title']");
-            const ogMeta = document.querySelector('meta[property="og:title"], meta[name="og:title"]');
-            return { blockingScript: !!blockingScript, captcha: !!captcha, tooMany, productReady: !!(title || ogMeta) };
-        }
-        """
-
-        wait_condition = """
-        () => {
-            const title = document.querySelector("h1[data-testid='product-title']");
-            const og = document.querySelector("meta[property='og:title'], meta[name='og:title']");
-            return !!(title || og);
-        }
-        """
-
-        for attempt in range(6):
+        # The scripts are passed as source on purpose: each retry re-navigates,
+        # which tears down the execution context and any JSHandle created in it.
+        for attempt in range(_CHEWY_NAVIGATION_ATTEMPTS):
             try:
-                await page.wait_for_function(wait_condition, timeout=12000)
+                await page.wait_for_function(
+                    _CHEWY_READY_SCRIPT,
+                    timeout=_CHEWY_READY_TIMEOUT_MS,
+                    polling=_CHEWY_READY_POLLING_MS,
+                )
+                return
             except Exception:  # noqa: BLE001
                 pass
 
-            probe = await page.evaluate(probe_script)
-            if probe.get("productReady") and not (
-                probe.get("blockingScript") or probe.get("captcha") or probe.get("tooMany")
-            ):
-                return
-
+            blocking, captcha, too_many, ready = await page.evaluate(_CHEWY_PROBE_SCRIPT)
             LOGGER.info(
-                "Chewy challenge detected (attempt %s): %s", attempt + 1, probe
+                "Chewy challenge detected (attempt %s): blocking=%s captcha=%s "
+                "too_many=%s product_ready=%s",
+                attempt + 1,
+                blocking,
+                captcha,
+                too_many,
+                ready,
             )
+            if attempt + 1 == _CHEWY_NAVIGATION_ATTEMPTS:
+                break
             await asyncio.sleep(5 + attempt * 2)
-            if attempt >= 2:
-                await self._navigate(
-                    page,
-                    url,
-                    wait_until="networkidle",
-                    referer="https://www.chewy.com/",
-                    allow_retry=False,
-                )
+            await self._navigate(
+                page,
+                url,
+                wait_until="networkidle",
+                referer="https://www.chewy.com/",
+                allow_retry=False,
+            )
 
         LOGGER.warning("Chewy content still not available after retries for %s", url)
 
@@ -216,10 +408,11 @@ class ScraperService:
                     timeout=self.navigation_timeout_ms,
                     referer=referer,
                 )
-            try:
-                await page.wait_for_load_state("networkidle", timeout=4000)
-            except Exception:  # noqa: BLE001
-                pass
+            if wait_until != "networkidle":
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=4000)
+                except Exception:  # noqa: BLE001
+                    pass
             if self.wait_after_load_ms:
                 await asyncio.sleep(self.wait_after_load_ms / 1000)
         except HTTPException:
@@ -228,79 +421,35 @@ class ScraperService:
             LOGGER.warning("Failed to load %s: %s", url, exc)
             raise HTTPException(status_code=502, detail="Navigation failed") from exc
 
-    async def _extract_payload(self, page: Page, url: str) -> dict[str, Any]:
-        html = await page.content()
-        title = await page.title()
-        lang = await page.evaluate("() => document.documentElement.lang || ''")
-        meta = await self._collect_meta(page)
+    async def _extract_payload(
+        self, page: Page, url: str, *, need_html: bool = True
+    ) -> dict[str, Any]:
+        try:
+            extracted = await page.evaluate(_EXTRACT_PAGE_SCRIPT, need_html)
+        except PlaywrightError:
+            LOGGER.debug("Falling back to page.content() for %s", url, exc_info=True)
+            html = await page.content() if need_html else None
+            extracted = {"title": "", "lang": "", "meta": [], "html": html}
+        # The script returns meta tags as a flat [key, value, ...] array. Keys
+        # come from a small vocabulary repeated on every page.
+        pairs = iter(extracted["meta"])
+        meta = {sys.intern(key): value for key, value in zip(pairs, pairs)}
+        html = extracted["html"]
         excerpt = meta.get("description") or meta.get("og:description") or ""
         result = {
             "source": url,
-            "title": title.strip() if title else "",
+            "title": (extracted["title"] or "").strip(),
             "excerpt": excerpt.strip(),
-            "lang": (lang or "").strip() or None,
+            "lang": (extracted["lang"] or "").strip() or None,
             "meta": meta,
             "content": html,
             "fullContent": html,
         }
         return result
 
-    async def _collect_meta(self, page: Page) -> dict[str, str]:
-        script = """
-        () => {
-            const tags = Array.from(document.querySelectorAll('meta'));
-            return tags.flatMap(tag => {
-                const key = tag.getAttribute('property') || tag.getAttribute('name');
-                if (!key) return [];
-                const value = tag.getAttribute('content');
-                if (!value) return [];
-                return [{ key, value }];
-            });
-        }
-        """
-        records = await page.evaluate(script)
-        return {entry["key"].strip(): entry["value"].strip() for entry in records}
-
-    async def _prime_page(self, page: Page) -> None:
-        override_script = """
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-            window.chrome = window.chrome || { runtime: {} };
-            Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
-            Object.defineProperty(navigator, 'language', { get: () => 'en-US' });
-            Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-            Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
-            Object.defineProperty(navigator, 'deviceMemory', { get: () => 8 });
-            Object.defineProperty(navigator, 'maxTouchPoints', { get: () => 0 });
-            if (!navigator.userAgentData) {
-                const uaData = {
-                    brands: [
-                        { brand: 'Chromium', version: '128' },
-                        { brand: 'Google Chrome', version: '128' },
-                        { brand: 'Not=A?Brand', version: '24' },
-                    ],
-                    mobile: false,
-                    platform: 'Windows',
-                    getHighEntropyValues: async () => ({
-                        architecture: 'x86',
-                        bitness: '64',
-                        model: '',
-                        platform: 'Windows',
-                        platformVersion: '15.0.0',
-                        uaFullVersion: '128.0.0.0',
-                        fullVersionList: [
-                            { brand: 'Chromium', version: '128.0.0.0' },
-                            { brand: 'Google Chrome', version: '128.0.0.0' },
-                            { brand: 'Not=A?Brand', version: '24.0.0.0' },
-                        ],
-                    }),
-                    toJSON: () => uaData,
-                };
-                Object.defineProperty(navigator, 'userAgentData', {
-                    get: () => uaData,
-                });
-            }
-        """
-        await page.add_init_script(override_script)
+    _FETCHERS: ClassVar[
+        dict[str, Callable[[ScraperService, str, bool], Awaitable[dict[str, Any]]]]
+    ] = {"chewy": _fetch_chewy, "generic": _fetch_generic}
 
 
 class ArticleResponse(BaseModel):
@@ -313,6 +462,9 @@ class ArticleResponse(BaseModel):
     source: HttpUrl
 
 
+_VALIDATE_ARTICLE = ArticleResponse.model_validate
+
+
 class DiagnosticsResponse(BaseModel):
     ok: bool
     notes: list[str]
@@ -334,23 +486,31 @@ async def lifespan(_: FastAPI) -> Any:
 app = FastAPI(title="CostCourter Scraper", lifespan=lifespan)
 
 
-def scrub_response(raw: dict[str, Any], full_content: bool) -> dict[str, Any]:
-    payload = dict(raw)
+def _render_article(article: ArticleResponse) -> HTTPResponse:
+    """Serialise a validated article with pydantic-core.
+
+    Returning a ``Response`` stops FastAPI from validating the model a second
+    time against ``response_model`` and re-encoding it through ``json.dumps``.
+    """
+
+    return HTTPResponse(content=article.model_dump_json(), media_type="application/json")
+
+
+def scrub_response(
+    raw: dict[str, Any], full_content: bool, *, copy: bool = True
+) -> dict[str, Any]:
+    payload = dict(raw) if copy else raw
     payload["title"] = (payload.get("title") or "").strip()
     payload["excerpt"] = (payload.get("excerpt") or "").strip()
     lang_value = payload.get("lang")
-    if isinstance(lang_value, str):
-        payload["lang"] = lang_value.strip()
-    if not full_content:
-        payload["fullContent"] = None
+    lang = lang_value.strip() if isinstance(lang_value, str) else lang_value
+    if lang:
+        payload["lang"] = lang
+    else:
+        payload.pop("lang", None)
+    payload["fullContent"] = payload.get("fullContent") if full_content else None
     if payload.get("content") is None:
         payload.pop("content", None)
-    if not payload.get("title"):
-        payload["title"] = ""
-    if not payload.get("excerpt"):
-        payload["excerpt"] = ""
-    if not payload.get("lang"):
-        payload.pop("lang", None)
     return payload
 
 
@@ -366,29 +526,30 @@ async def get_article(
     url: HttpUrl = Query(..., description="Target URL to scrape"),
     full_content: bool = Query(False, alias="full-content"),
     cache: bool = Query(False, description="Ignored placeholder"),
-) -> ArticleResponse:
+) -> HTTPResponse:
     _ = cache
     try:
-        raw = await scraper_service.fetch(str(url))
+        raw = await scraper_service.fetch(str(url), need_html=full_content)
     except HTTPException:
         raise
     except Exception as exc:  # noqa: BLE001
         LOGGER.exception("Unhandled scraper error for %s", url)
         raise HTTPException(status_code=500, detail="Unhandled scraper error") from exc
-    payload = scrub_response(raw, full_content=full_content)
+    payload = scrub_response(raw, full_content=full_content, copy=False)
     try:
-        return ArticleResponse.model_validate(payload)
+        article = _VALIDATE_ARTICLE(payload)
     except Exception as exc:  # noqa: BLE001
         LOGGER.exception("Invalid payload produced for %s: %s", url, exc)
         raise HTTPException(status_code=500, detail="Invalid payload generated") from exc
+    return _render_article(article)
 
 
 @app.post("/api/html", response_model=ArticleResponse)
-async def fetch_via_post(body: dict[str, Any]) -> ArticleResponse:
+async def fetch_via_post(body: dict[str, Any]) -> HTTPResponse:
     url = body.get("url")
     if not isinstance(url, str) or not url:
         raise HTTPException(status_code=422, detail="url is required")
     full_content = bool(body.get("fullContent"))
-    raw = await scraper_service.fetch(url)
-    payload = scrub_response(raw, full_content=full_content)
-    return ArticleResponse.model_validate(payload)
+    raw = await scraper_service.fetch(url, need_html=full_content)
+    payload = scrub_response(raw, full_content=full_content, copy=False)
+    return _render_article(_VALIDATE_ARTICLE(payload))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import ScraperService, app
+
+_RAW_ARTICLE = {
+    "source": "https://example.com/item",
+    "title": " Widget ",
+    "excerpt": "A widget",
+    "lang": "",
+    "meta": {"og:title": "Widget"},
+    "content": "<html></html>",
+    "fullContent": "<html></html>",
+}
+
+
+@pytest.fixture(name="html_requests")
+def html_requests_fixture(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    html_requests: list[bool] = []
+
+    async def fake_fetch(
+        _self: ScraperService, _url: str, *, need_html: bool
+    ) -> dict[str, Any]:
+        html_requests.append(need_html)
+        return dict(_RAW_ARTICLE)
+
+    monkeypatch.setattr(ScraperService, "fetch", fake_fetch)
+    return html_requests
+
+
+@pytest.fixture(name="client")
+def client_fixture(html_requests: list[bool]) -> TestClient:
+    return TestClient(app)
+
+
+def test_get_article_serialises_validated_payload(
+    client: TestClient, html_requests: list[bool]
+) -> None:
+    response = client.get("/api/article", params={"url": "https://example.com/item"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "title": "Widget",
+        "excerpt": "A widget",
+        "lang": None,
+        "meta": {"og:title": "Widget"},
+        "content": "<html></html>",
+        "fullContent": None,
+        "source": "https://example.com/item",
+    }
+    assert html_requests == [False]
+
+
+def test_fetch_via_post_keeps_full_content(
+    client: TestClient, html_requests: list[bool]
+) -> None:
+    response = client.post(
+        "/api/html", json={"url": "https://example.com/item", "fullContent": True}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["fullContent"] == "<html></html>"
+    assert html_requests == [True]
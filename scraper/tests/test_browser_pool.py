@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from playwright.async_api import Browser, BrowserContext
+
+from app.main import _OVERRIDE_SCRIPT, BrowserPool
+
+
+class FakePage:
+    def __init__(self, context: FakeContext) -> None:
+        self._context = context
+
+    async def close(self) -> None:
+        self._context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self, storage_state: dict[str, Any] | None) -> None:
+        self.seeded_state = storage_state
+        self.init_scripts: list[str] = []
+        self.pages: list[FakePage] = []
+        self.cookies: list[dict[str, str]] = []
+        self.permissions: list[str] = []
+        self.closed = False
+        self.fail_close = False
+
+    async def add_init_script(self, script: str) -> None:
+        self.init_scripts.append(script)
+
+    async def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self) -> None:
+        self.cookies.clear()
+
+    async def clear_permissions(self) -> None:
+        self.permissions.clear()
+
+    async def close(self) -> None:
+        if self.fail_close:
+            raise RuntimeError("target closed")
+        self.closed = True
+
+    async def storage_state(self) -> dict[str, Any]:
+        return {"cookies": [{"name": "session", "value": str(len(self.init_scripts))}]}
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.created: list[FakeContext] = []
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def new_context(self, **kwargs: Any) -> FakeContext:
+        context = FakeContext(kwargs.get("storage_state"))
+        self.created.append(context)
+        return context
+
+
+@pytest.mark.asyncio
+async def test_context_reuses_warmed_contexts() -> None:
+    browser = FakeBrowser()
+    pool = BrowserPool(browser=cast(Browser, browser), initial_size=1)
+    pool.contexts.put_nowait(await pool._new_context())
+
+    async with pool.context() as first:
+        await first.new_page()
+        cast(FakeContext, first).cookies.append({"name": "session", "value": "a"})
+        cast(FakeContext, first).permissions.append("geolocation")
+    async with pool.context() as second:
+        assert second is first
+
+    reused = cast(FakeContext, second)
+    assert len(browser.created) == 1
+    assert reused.init_scripts == [_OVERRIDE_SCRIPT]
+    assert reused.pages == []
+    assert reused.cookies == []
+    assert reused.permissions == []
+    assert reused.closed is False
+
+
+@pytest.mark.asyncio
+async def test_context_isolates_unpooled_and_overflow_contexts() -> None:
+    browser = FakeBrowser()
+    pool = BrowserPool(browser=cast(Browser, browser), initial_size=1)
+
+    async with pool.context(storage_state={"cookies": []}) as seeded:
+        assert cast(FakeContext, seeded).seeded_state == {"cookies": []}
+    assert cast(FakeContext, seeded).closed is True
+    assert pool.contexts.empty()
+
+    async with pool.context() as first, pool.context() as second:
+        assert first is not second
+    assert pool.contexts.qsize() == 1
+    assert [context.closed for context in browser.created[1:]] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_save_state_is_throttled_per_host() -> None:
+    pool = BrowserPool()
+    context = cast(BrowserContext, FakeContext(None))
+
+    assert pool.get_state("chewy.com") is None
+    await pool.save_state("chewy.com", context, min_interval=60)
+    assert pool.get_state("chewy.com") == {
+        "cookies": [{"name": "session", "value": "0"}]
+    }
+
+    await cast(FakeContext, context).add_init_script("script")
+    await pool.save_state("chewy.com", context, min_interval=60)
+    assert pool.get_state("chewy.com") == {
+        "cookies": [{"name": "session", "value": "0"}]
+    }
+
+    async with pool._state_lock:
+        await pool.save_state("chewy.com", context, min_interval=0)
+    assert pool.get_state("chewy.com") == {
+        "cookies": [{"name": "session", "value": "0"}]
+    }
+
+    await pool.save_state("chewy.com", context, min_interval=0)
+    assert pool.get_state("chewy.com") == {
+        "cookies": [{"name": "session", "value": "1"}]
+    }
+    assert pool.get_state("example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_every_context_despite_failures() -> None:
+    browser = FakeBrowser()
+    pool = BrowserPool(browser=cast(Browser, browser), initial_size=3)
+    for _ in range(3):
+        pool.contexts.put_nowait(await pool._new_context())
+    browser.created[0].fail_close = True
+
+    await pool.shutdown()
+
+    assert [context.closed for context in browser.created] == [False, True, True]
+    assert pool.contexts.empty()
+    assert browser.closed is True
+    assert pool.browser is None
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from playwright.async_api import Page
+
+import app.main as scraper_main
+from app.main import _CHEWY_READY_SCRIPT, BrowserPool, ScraperService
+
+
+class FakePage:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.waits: list[tuple[str, dict[str, Any]]] = []
+        self.probes = 0
+
+    async def wait_for_function(self, script: str, **kwargs: Any) -> None:
+        self.waits.append((script, kwargs))
+        if self.failures:
+            self.failures -= 1
+            raise TimeoutError("product not ready")
+
+    async def evaluate(self, _script: str) -> list[bool]:
+        self.probes += 1
+        return [False, True, False, False]
+
+
+@pytest.fixture(name="navigations")
+def navigations_fixture(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    navigations: list[str] = []
+
+    async def fake_navigate(
+        _self: ScraperService, _page: Page, url: str, **_: Any
+    ) -> None:
+        navigations.append(url)
+
+    async def no_sleep(_delay: float) -> None:
+        return None
+
+    monkeypatch.setattr(ScraperService, "_navigate", fake_navigate)
+    monkeypatch.setattr(scraper_main.asyncio, "sleep", no_sleep)
+    return navigations
+
+
+@pytest.mark.asyncio
+async def test_ensure_chewy_content_returns_once_page_is_ready(
+    navigations: list[str],
+) -> None:
+    page = FakePage(failures=0)
+    service = ScraperService(pool=BrowserPool())
+
+    await service._ensure_chewy_content(cast(Page, page), "https://www.chewy.com/dp/1")
+
+    assert page.waits == [(_CHEWY_READY_SCRIPT, {"timeout": 30000, "polling": 500})]
+    assert page.probes == 0
+    assert navigations == []
+
+
+@pytest.mark.asyncio
+async def test_ensure_chewy_content_renavigates_only_after_timeouts(
+    navigations: list[str],
+) -> None:
+    page = FakePage(failures=5)
+    service = ScraperService(pool=BrowserPool())
+
+    await service._ensure_chewy_content(cast(Page, page), "https://www.chewy.com/dp/1")
+
+    assert len(page.waits) == 3
+    assert page.probes == 3
+    assert navigations == ["https://www.chewy.com/dp/1"] * 2
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, cast
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page
+
+from app.main import _EXTRACT_PAGE_SCRIPT, BrowserPool, ScraperService
+
+
+class FakePage:
+    def __init__(self, extracted: dict[str, Any] | None) -> None:
+        self._extracted = extracted
+        self.scripts: list[tuple[str, bool]] = []
+
+    async def evaluate(self, script: str, include_html: bool) -> dict[str, Any]:
+        self.scripts.append((script, include_html))
+        if self._extracted is None:
+            raise PlaywrightError("execution context was destroyed")
+        return self._extracted
+
+    async def content(self) -> str:
+        return "<html>fallback</html>"
+
+
+@pytest.mark.asyncio
+async def test_extract_payload_reads_page_in_one_evaluate() -> None:
+    page = FakePage(
+        {
+            "title": " Widget ",
+            "lang": "en",
+            "meta": ["og:description", "A widget", "og:title", "Widget"],
+            "html": "<!DOCTYPE html><html></html>",
+        }
+    )
+    service = ScraperService(pool=BrowserPool())
+
+    payload = await service._extract_payload(cast(Page, page), "https://example.com")
+
+    assert page.scripts == [(_EXTRACT_PAGE_SCRIPT, True)]
+    assert payload == {
+        "source": "https://example.com",
+        "title": "Widget",
+        "excerpt": "A widget",
+        "lang": "en",
+        "meta": {"og:description": "A widget", "og:title": "Widget"},
+        "content": "<!DOCTYPE html><html></html>",
+        "fullContent": "<!DOCTYPE html><html></html>",
+    }
+    assert all(key is sys.intern(key) for key in payload["meta"])
+
+
+@pytest.mark.asyncio
+async def test_extract_payload_falls_back_to_page_content() -> None:
+    service = ScraperService(pool=BrowserPool())
+
+    payload = await service._extract_payload(
+        cast(Page, FakePage(None)), "https://example.com"
+    )
+
+    assert payload["content"] == "<html>fallback</html>"
+    assert payload["meta"] == {}
+    assert payload["title"] == ""
+    assert payload["lang"] is None
+
+
+@pytest.mark.asyncio
+async def test_extract_payload_skips_html_when_not_needed() -> None:
+    page = FakePage(None)
+    service = ScraperService(pool=BrowserPool())
+
+    payload = await service._extract_payload(
+        cast(Page, page), "https://example.com", need_html=False
+    )
+
+    assert page.scripts == [(_EXTRACT_PAGE_SCRIPT, False)]
+    assert payload["content"] is None
+    assert payload["fullContent"] is None
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.main import BrowserPool, ScraperService, _classify_host
+
+
+@pytest.mark.parametrize(
+    ("hostname", "expected"),
+    [
+        ("www.chewy.com", "chewy"),
+        ("chewy.com", "chewy"),
+        ("example.com", "generic"),
+        ("", "generic"),
+    ],
+)
+def test_classify_host(hostname: str, expected: str) -> None:
+    assert _classify_host(hostname) == expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_dispatches_on_cached_host_classification(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[str, str, bool]] = []
+
+    async def fake_chewy(
+        _self: ScraperService, url: str, need_html: bool
+    ) -> dict[str, Any]:
+        calls.append(("chewy", url, need_html))
+        return {}
+
+    async def fake_generic(
+        _self: ScraperService, url: str, need_html: bool
+    ) -> dict[str, Any]:
+        calls.append(("generic", url, need_html))
+        return {}
+
+    monkeypatch.setattr(
+        ScraperService, "_FETCHERS", {"chewy": fake_chewy, "generic": fake_generic}
+    )
+    _classify_host.cache_clear()
+    service = ScraperService(pool=BrowserPool())
+
+    await service.fetch("https://www.chewy.com/dp/1")
+    await service.fetch("https://www.chewy.com/dp/2", need_html=False)
+    await service.fetch("https://example.com/item")
+
+    assert calls == [
+        ("chewy", "https://www.chewy.com/dp/1", True),
+        ("chewy", "https://www.chewy.com/dp/2", False),
+        ("generic", "https://example.com/item", True),
+    ]
+    assert _classify_host.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_chewy_caps_concurrent_scrapes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    active = 0
+    peak = 0
+
+    async def fake_scrape(
+        _self: ScraperService, url: str, _need_html: bool
+    ) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return {"source": url}
+
+    monkeypatch.setattr(ScraperService, "_scrape_chewy", fake_scrape)
+    service = ScraperService(pool=BrowserPool(), chewy_concurrency=2)
+
+    results = await asyncio.gather(
+        *(service.fetch(f"https://www.chewy.com/dp/{index}") for index in range(5))
+    )
+
+    assert [result["source"] for result in results] == [
+        f"https://www.chewy.com/dp/{index}" for index in range(5)
+    ]
+    assert peak == 2
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from playwright.async_api import Page
+
+from app.main import BrowserPool, ScraperService
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def goto(self, _url: str, **kwargs: Any) -> None:
+        self.calls.append(f"goto:{kwargs['wait_until']}")
+
+    async def wait_for_load_state(self, state: str, **_: Any) -> None:
+        self.calls.append(f"wait:{state}")
+
+
+@pytest.mark.parametrize(
+    ("wait_until", "expected"),
+    [
+        ("domcontentloaded", ["goto:domcontentloaded", "wait:networkidle"]),
+        ("networkidle", ["goto:networkidle"]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_navigate_only_waits_for_network_idle_when_goto_did_not(
+    wait_until: str, expected: list[str]
+) -> None:
+    page = FakePage()
+    service = ScraperService(pool=BrowserPool(), wait_after_load_ms=0)
+
+    await service._navigate(
+        cast(Page, page), "https://example.com", wait_until=wait_until
+    )
+
+    assert page.calls == expected
@@ -32,3 +32,15 @@ def test_scrub_response_keeps_lang() -> None:
     cleaned = scrub_response(raw, full_content=True)
     assert cleaned["lang"] == "en-US"
     assert cleaned["fullContent"] == "<html></html>"
+
+
+def test_scrub_response_copy_flag_controls_mutation() -> None:
+    raw = {"title": " Product ", "lang": " ", "fullContent": "<html></html>"}
+
+    copied = scrub_response(raw, full_content=False)
+    assert copied is not raw
+    assert raw["title"] == " Product "
+
+    mutated = scrub_response(raw, full_content=False, copy=False)
+    assert mutated is raw
+    assert raw == {"title": "Product", "excerpt": "", "fullContent": None}